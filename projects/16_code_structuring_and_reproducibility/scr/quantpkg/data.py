@@ -2,7 +2,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-from typing import Optional
+from scipy.signal import lfilter
+from typing import Dict, Optional, Tuple
 
 @dataclass
 class DataGenerator:
@@ -43,33 +44,24 @@ class DataGenerator:
     n_steps: int
     seed: Optional[int] = None
 
-    def generate(self) -> pd.DataFrame:
-        """Simulate the AR(1) volatility, log-returns, and price series.
-        
-        Returns
-        -------
-        pd.DataFrame
-            Columns:    ['log_returns', 'price', 'sigma']
-            Index:  DatetimeIndex (daily frequency by default)  
-        """
+    def _simulate(self, n_paths: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Simulate `n_paths` paths as (n_paths, n_steps) arrays of returns, prices and sigma."""
         if self.seed is not None:
             np.random.seed(self.seed)
 
-        # --- Pre-allocate arrays ---
-
-        sig = np.zeros(self.n_steps)
-        rets = np.zeros(self.n_steps)
-        sig[0] = self.sigma0
-
         # --- Random Shocks ---
+        # per path: n_steps eps draws followed by n_steps eta draws
 
-        eps = np.random.randn(self.n_steps)
-        eta = np.random.randn(self.n_steps) * self.xi
+        z = np.random.randn(n_paths, 2, self.n_steps)
+        eps = z[:, 0]
+        eta = z[:, 1] * self.xi
 
         # --- Simulate sigma_t ---
+        # sig[t] = alpha + beta * sig[t-1] + eta[t] as a linear filter along time
 
-        for t in range(1, self.n_steps):
-            sig[t] = self.alpha + self.beta * sig[t-1] + eta[t]
+        x = self.alpha + eta
+        x[:, 0] = self.sigma0
+        sig = lfilter([1.0], [1.0, -self.beta], x, axis=1)
 
         # --- Simulate Returns ---
 
@@ -78,15 +70,45 @@ class DataGenerator:
 
         # --- Construct Price Path ---
 
-        price = np.exp(np.cumsum(rets))
+        price = np.exp(np.cumsum(rets, axis=1))
+
+        return rets, price, sig
+
+    def generate(self) -> pd.DataFrame:
+        """Simulate the AR(1) volatility, log-returns, and price series.
+        
+        Returns
+        -------
+        pd.DataFrame
+            Columns:    ['log_return', 'price', 'sigma']
+            Index:  DatetimeIndex (daily frequency by default)  
+        """
+        rets, price, sig = self._simulate(1)
 
         # --- Build DataFrame ---
 
         idx = pd.date_range(start = "2000-01-01", periods = self.n_steps, freq = "D")
         df = pd.DataFrame({
-            "log_returns": rets,
-            "price": price,
-            "sigma": sig,
+            "log_return": rets[0],
+            "price": price[0],
+            "sigma": sig[0],
         }, index = idx)
 
-        return df
\ No newline at end of file
+        return df
+
+    def generate_paths(self, n_paths: int) -> Dict[str, np.ndarray]:
+        """Simulate `n_paths` paths in a single vectorised batch.
+
+        Parameters
+        ----------
+        n_paths : int
+            Number of independent paths.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Keys 'log_return', 'price', 'sigma', each of shape (n_paths, n_steps).
+            Path 0 is bit-for-bit identical to `generate()` for the same seed.
+        """
+        rets, price, sig = self._simulate(int(n_paths))
+        return {"log_return": rets, "price": price, "sigma": sig}
@@ -16,3 +16,17 @@ def test_data_generator_basic():
     assert "log_return" in df.columns
     assert "price" in df.columns
     assert "sigma" in df.columns
+
+
+def test_generate_paths_matches_single_path():
+    gen = DataGenerator(
+        mu=0.02, alpha=0.1, beta=0.85, xi=0.1,
+        sigma0=0.2, dt=1/252, n_steps=200, seed=7
+    )
+    df = gen.generate()
+    paths = gen.generate_paths(50)
+
+    assert paths["log_return"].shape == (50, 200)
+    assert (paths["log_return"][0] == df["log_return"].values).all()
+    assert (paths["price"][0] == df["price"].values).all()
+    assert (paths["sigma"][0] == df["sigma"].values).all()
@@ -0,0 +1,163 @@
+# benchmarks/bench_quantpkg.py
+"""
+Benchmark the quantpkg hot paths across data sizes.
+
+    python benchmarks/bench_quantpkg.py run [--sizes 1e3 1e4 ...] [--repeat 3] [--history FILE]
+    python benchmarks/bench_quantpkg.py compare [BASE_ID HEAD_ID] [--threshold 0.10]
+
+`run` appends one record (wall time, peak RSS, peak traced allocations per
+case and size) to a JSON history file. `compare` diffs two records (default:
+the last two) and exits non-zero if any case regressed past the threshold.
+Each (case, size) runs in a fresh process so peak RSS is not polluted by
+earlier, larger cases.
+"""
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from quantpkg.config import Config
+from quantpkg.data import DataGenerator
+from quantpkg.features import FeatureEngineer
+from quantpkg.strategy import Strategy
+from quantpkg.backtest import Backtester
+
+CASES = ["generate", "features", "strategy", "backtest"]
+DEFAULT_SIZES = [1e3, 1e4, 1e5, 1e6, 1e7]
+DEFAULT_HISTORY = Path(__file__).with_name("history.json")
+
+def _setup(case: str, n: int):
+    """Build the inputs for one case outside the timed region; returns a zero-arg callable."""
+    cfg = Config(n_steps=n)
+    gen_kw = dict(mu=cfg.mu, alpha=cfg.alpha, beta=cfg.beta, xi=cfg.xi,
+                  sigma0=cfg.sigma0, dt=cfg.dt, n_steps=n, seed=cfg.seed)
+    if case == "generate":
+        return lambda: DataGenerator(**gen_kw).generate()
+    df = DataGenerator(**gen_kw).generate()
+    fe = FeatureEngineer(window=cfg.window)
+    if case == "features":
+        return lambda: fe.add_rolling_features(df)
+    df = fe.add_rolling_features(df)
+    strat = Strategy(theta=cfg.theta)
+    if case == "strategy":
+        return lambda: strat.generate_positions(df)
+    df = strat.generate_positions(df)
+    bt = Backtester(initial_capital=cfg.initial_capital, freq_per_year=cfg.freq_per_year)
+    if case == "backtest":
+        return lambda: bt.run(df)
+    raise ValueError(f"unknown case {case!r}")
+
+def _measure(case: str, n: int, repeat: int) -> dict:
+    fn = _setup(case, n)
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+    return {"case": case, "n_steps": n, "wall_s": min(times),
+            "peak_rss_mb": rss_mb, "alloc_peak_mb": alloc_peak / 2**20}
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, cwd=Path(__file__).parent, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def load_history(path: Path) -> list:
+    return json.loads(path.read_text()) if path.exists() else []
+
+def run(sizes, repeat: int, history: Path, cases=CASES) -> dict:
+    results = []
+    for n in sizes:
+        for case in cases:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                res = pool.submit(_measure, case, int(n), repeat).result()
+            print(f"{case:>9} n={res['n_steps']:>10,}  {res['wall_s']:9.4f} s  "
+                  f"rss {res['peak_rss_mb']:8.1f} MiB  alloc {res['alloc_peak_mb']:8.1f} MiB")
+            results.append(res)
+
+    records = load_history(history)
+    record = {
+        "id": len(records),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": _git_rev(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": results,
+    }
+    records.append(record)
+    history.write_text(json.dumps(records, indent=2))
+    print(f"recorded run {record['id']} in {history}")
+    return record
+
+# absolute floors below which a relative change is treated as timer/allocator noise
+MIN_DELTA = {"wall_s": 2e-3, "alloc_peak_mb": 0.5}
+
+def compare(base: dict, head: dict, threshold: float) -> list:
+    """Rows of (case, n, metric, base, head, ratio, flag) for cases present in both runs."""
+    base_res = {(r["case"], r["n_steps"]): r for r in base["results"]}
+    rows = []
+    for r in head["results"]:
+        b = base_res.get((r["case"], r["n_steps"]))
+        if b is None:
+            continue
+        for metric in ("wall_s", "alloc_peak_mb"):
+            ratio = r[metric] / b[metric] if b[metric] > 0 else np.nan
+            regressed = ratio > 1 + threshold and r[metric] - b[metric] > MIN_DELTA[metric]
+            flag = "REGRESSION" if regressed else ""
+            rows.append((r["case"], r["n_steps"], metric, b[metric], r[metric], ratio, flag))
+    return rows
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="quantpkg hot path benchmarks")
+    p.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    pr = sub.add_parser("run")
+    pr.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES)
+    pr.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    pr.add_argument("--repeat", type=int, default=3)
+
+    pc = sub.add_parser("compare")
+    pc.add_argument("ids", type=int, nargs="*", help="base and head run ids (default: last two)")
+    pc.add_argument("--threshold", type=float, default=0.10)
+
+    args = p.parse_args(argv)
+    if args.cmd == "run":
+        run(args.sizes, args.repeat, args.history, args.cases)
+        return 0
+
+    records = {r["id"]: r for r in load_history(args.history)}
+    ids = args.ids or sorted(records)[-2:]
+    if len(ids) != 2 or any(i not in records for i in ids):
+        p.error("need two recorded run ids")
+    rows = compare(records[ids[0]], records[ids[1]], args.threshold)
+    print(f"run {ids[0]} -> run {ids[1]} (threshold {args.threshold:.0%})")
+    for case, n, metric, b, h, ratio, flag in rows:
+        print(f"{case:>9} n={n:>10,} {metric:>14}: {b:10.4f} -> {h:10.4f}  x{ratio:5.2f}  {flag}")
+    return 1 if any(r[-1] for r in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
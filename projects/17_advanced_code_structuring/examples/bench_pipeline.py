@@ -0,0 +1,39 @@
+# examples/bench_pipeline.py
+# Wall time and peak traced memory: DataFrame pipeline vs quantpkg.pipeline.run_arrays.
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from quantpkg.features import FeatureEngineer
+from quantpkg.strategy import Strategy
+from quantpkg.backtest import Backtester
+from quantpkg.pipeline import run_arrays
+
+def dataframe_path(r, window, theta):
+    df = pd.DataFrame({'log_return': r})
+    df = FeatureEngineer(window=window).add_rolling_features(df)
+    df = Strategy(theta=theta).generate_positions(df)
+    return Backtester().run(df)
+
+def array_path(r, window, theta):
+    return run_arrays(r, window=window, theta=theta)
+
+def measure(fn, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main(n=1_000_000, window=20, theta=1.0):
+    r = np.random.default_rng(0).normal(scale=0.01, size=n)
+    print(f"n={n:,}  input={r.nbytes / 2**20:.1f} MiB")
+    for name, fn in [("dataframe", dataframe_path), ("run_arrays", array_path)]:
+        elapsed, peak = measure(fn, r, window, theta)
+        print(f"{name:>10}: {elapsed:8.3f} s   peak {peak / 2**20:8.1f} MiB")
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000)
@@ -1,2 +1,2 @@
 # src/quantpkg/__init__.py
-__all__ = ["config", "data", "features", "strategy", "backtest"]
\ No newline at end of file
+__all__ = ["config", "data", "features", "strategy", "backtest", "pipeline", "sweep", "montecarlo", "cache", "walkforward"]
\ No newline at end of file
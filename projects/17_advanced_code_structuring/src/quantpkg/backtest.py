@@ -21,3 +21,57 @@ class Backtester:
         sharpe = (mean / vol) * np.sqrt(self.freq_per_year) if vol > 0 else np.nan
         stats = {"mean_return": float(mean), "volatility": float(vol), "sharpe": float(sharpe)}
         return {"df": out, "stats": stats}
+
+    def run_panel(self, returns: np.ndarray, positions: np.ndarray, cost_bps: float = 0.0,
+                  dtype=np.float64) -> Dict[str, Any]:
+        """
+        Vectorised multi-asset backtest on (T, N) return and position arrays.
+
+        Same execution rule as run (position lagged one period, wealth =
+        cumprod(1 + ret)), plus a cost of cost_bps basis points per unit of
+        turnover |pos_{t-1} - pos_{t-2}| charged on the bar the trade takes
+        effect. The portfolio puts equal capital in each asset, so its return
+        is the cross-sectional mean. The (T, N) work runs in dtype
+        (e.g. np.float32 to halve memory); stats accumulate in float64.
+
+        Returns a dict with (T, N) arrays "returns", "turnover", "nav",
+        portfolio "portfolio_returns" / "portfolio_nav" (T,), aggregate
+        "stats" and per-asset "asset_stats" arrays.
+        """
+        r = np.asarray(returns, dtype=dtype)
+        pos = np.asarray(positions, dtype=dtype)
+        if r.ndim != 2 or r.shape != pos.shape:
+            raise ValueError("returns and positions must be (T, N) arrays of the same shape.")
+
+        lag = np.zeros_like(pos)
+        lag[1:] = pos[:-1]
+
+        turnover = np.zeros_like(pos)
+        np.subtract(lag[1:], lag[:-1], out=turnover[1:])
+        np.abs(turnover, out=turnover)
+
+        net = lag * r
+        if cost_bps:
+            net -= (cost_bps * 1e-4) * turnover
+
+        nav = net + 1.0
+        np.cumprod(nav, axis=0, out=nav)
+        nav *= self.initial_capital
+
+        port_ret = net.mean(axis=1, dtype=np.float64)
+        port_nav = np.cumprod(1.0 + port_ret) * self.initial_capital
+
+        ann = np.sqrt(self.freq_per_year)
+        a_mean = net.mean(axis=0, dtype=np.float64)
+        a_vol = net.std(axis=0, ddof=1, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a_sharpe = np.where(a_vol > 0, a_mean / a_vol * ann, np.nan)
+
+        mean = port_ret.mean()
+        vol = port_ret.std(ddof=1)
+        sharpe = (mean / vol) * ann if vol > 0 else np.nan
+        stats = {"mean_return": float(mean), "volatility": float(vol), "sharpe": float(sharpe),
+                 "turnover": float(turnover.sum(dtype=np.float64) / r.shape[1])}
+        return {"returns": net, "turnover": turnover, "nav": nav,
+                "portfolio_returns": port_ret, "portfolio_nav": port_nav, "stats": stats,
+                "asset_stats": {"mean_return": a_mean, "volatility": a_vol, "sharpe": a_sharpe}}
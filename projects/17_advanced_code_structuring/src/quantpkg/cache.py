@@ -0,0 +1,90 @@
+# src/quantpkg/cache.py
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from .config import Config
+from .data import DataGenerator
+
+# fields that determine the simulated series; bump the version if DataGenerator changes
+KEY_FIELDS = ("mu", "alpha", "beta", "xi", "sigma0", "dt", "n_steps", "seed")
+CACHE_VERSION = 2
+COLUMNS = ["log_return", "price", "sigma"]
+
+def config_key(cfg: Config, start_date = "2020-01-01", freq = "B") -> str:
+    """Stable content hash of the generator fields of a Config and the date index."""
+    payload = {k: repr(getattr(cfg, k)) for k in KEY_FIELDS}
+    payload["index"] = [str(pd.Timestamp(start_date)), str(freq)]
+    payload["version"] = CACHE_VERSION
+    blob = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()[:32]
+
+class DataCache:
+    """
+    On-disk cache for DataGenerator.generate keyed by
+    config_key(cfg, start_date, freq).
+
+    Each entry is one uncompressed .npz bundle of the (n_steps, 3) float64
+    columns and the DatetimeIndex as int64 nanoseconds, so a hit is two
+    array reads and never rebuilds the calendar with pd.date_range (which
+    costs about as much as the simulation on long business-day series).
+    Entries are evicted least-recently-used first once the directory
+    exceeds max_bytes. Unseeded configs (seed=None) are never cached: each
+    call draws a fresh sample, as DataGenerator(seed=None) does.
+    """
+    def __init__(self, root="quantpkg_cache", max_bytes: int = 1 << 30):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, cfg: Config, start_date = "2020-01-01", freq = "B") -> Path:
+        return self.root / f"{config_key(cfg, start_date, freq)}.npz"
+
+    def generate(self, cfg: Config, start_date = "2020-01-01", freq = "B") -> pd.DataFrame:
+        if cfg.seed is None:
+            return self._generator(cfg).generate(start_date=start_date, freq=freq)
+        p = self.path(cfg, start_date, freq)
+        if p.exists():
+            self._touch(p)
+            with np.load(p) as bundle:
+                arr = bundle["data"]
+                dates = pd.DatetimeIndex(bundle["index"].view("datetime64[ns]"))
+        else:
+            df = self._generator(cfg).generate(start_date=start_date, freq=freq)
+            arr = np.ascontiguousarray(df[COLUMNS].to_numpy(dtype=float))
+            dates = df.index
+            tmp = p.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.savez(f, data=arr, index=dates.as_unit("ns").asi8)
+            os.replace(tmp, p)
+            self._touch(p)
+            self._evict()
+        return pd.DataFrame(arr, columns=COLUMNS, index=dates, copy=False)
+
+    @staticmethod
+    def _touch(p: Path):
+        # mark as recently used; stamp with time_ns since the filesystem's own
+        # clock can be too coarse to order a hit after the write just before it
+        now = time.time_ns()
+        os.utime(p, ns=(now, now))
+
+    @staticmethod
+    def _generator(cfg: Config) -> DataGenerator:
+        return DataGenerator(mu=cfg.mu, alpha=cfg.alpha, beta=cfg.beta, xi=cfg.xi,
+                             sigma0=cfg.sigma0, dt=cfg.dt, n_steps=cfg.n_steps, seed=cfg.seed)
+
+    def _evict(self):
+        entries = [(e.stat().st_mtime_ns, e.stat().st_size, e) for e in self.root.glob("*.npz")]
+        total = sum(size for _, size, _ in entries)
+        for _, size, e in sorted(entries, key=lambda t: t[0]):
+            if total <= self.max_bytes:
+                break
+            e.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for e in self.root.glob("*.npz"):
+            e.unlink(missing_ok=True)
@@ -2,7 +2,19 @@
 from dataclasses import dataclass
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from scipy.signal import lfilter
+from typing import Dict, Iterator, Tuple
+
+
+def ar1_sigma(alpha: float, beta: float, sigma0: float, eta: np.ndarray) -> np.ndarray:
+    """
+    sigma_t = alpha + beta * sigma_{t-1} + eta_t along the last axis, with sigma_0 = sigma0.
+    Computed as a first-order linear filter so whole (n_paths, n_steps) blocks run in C.
+    """
+    x = alpha + eta
+    x[..., 0] = sigma0
+    return lfilter([1.0], [1.0, -beta], x, axis=-1)
+
 
 class DataGenerator:
     """
@@ -20,19 +32,77 @@ class DataGenerator:
         self.n_steps = int(n_steps)
         self.rng = np.random.default_rng(seed)
 
-    def generate(self, start_date = "2020-01-01", freq = "B") -> pd.DataFrame:
-        eps = self.rng.standard_normal(self.n_steps)
-        eta = self.rng.normal(scale = self.xi, size = self.n_steps)
+    def _simulate(self, n_paths: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # each path draws eps then eta, exactly as consecutive single-path calls would
+        z = self.rng.standard_normal((n_paths, 2, self.n_steps))
+        eps = z[:, 0]
+        eta = self.xi * z[:, 1]
 
-        sigma = np.empty(self.n_steps)
-        sigma[0] = self.sigma0
-        for t in range(1, self.n_steps):
-            sigma[t] = self.alpha + self.beta * sigma[t-1] +eta[t]
-        
-        sigma = np.abs(sigma)
+        sigma = np.abs(ar1_sigma(self.alpha, self.beta, self.sigma0, eta))
 
         log_returns = self.mu * self.dt + sigma * np.sqrt(self.dt) * eps
-        prices = 100.0 * np.exp(np.cumsum(log_returns))
+        prices = 100.0 * np.exp(np.cumsum(log_returns, axis=1))
+        return log_returns, prices, sigma
+
+    def generate(self, start_date = "2020-01-01", freq = "B") -> pd.DataFrame:
+        log_returns, prices, sigma = self._simulate(1)
 
         dates = pd.date_range(start = start_date, periods = self.n_steps, freq = freq)
-        df = pd.DataFrame({'log_return': log_returns, 'price': prices, 'sigma': sigma}, index = dates)
+        df = pd.DataFrame({'log_return': log_returns[0], 'price': prices[0], 'sigma': sigma[0]}, index = dates)
+        return df
+
+    def generate_paths(self, n_paths: int, start_date = "2020-01-01", freq = "B") -> Dict[str, object]:
+        """
+        Simulate n_paths independent paths in one batch.
+
+        Returns a dict with (n_paths, n_steps) arrays 'log_return', 'price', 'sigma'
+        and the shared DatetimeIndex under 'index'. Row i is bit-for-bit what the
+        (i+1)-th call to generate() would return on a generator with the same seed.
+        """
+        out = self.simulate(n_paths)
+        out['index'] = pd.date_range(start = start_date, periods = self.n_steps, freq = freq)
+        return out
+
+    def simulate(self, n_paths: int) -> Dict[str, np.ndarray]:
+        """
+        generate_paths without the DatetimeIndex: just the (n_paths, n_steps)
+        'log_return', 'price' and 'sigma' arrays, for callers (e.g. Monte Carlo
+        workers) that never look at dates.
+        """
+        log_returns, prices, sigma = self._simulate(int(n_paths))
+        return {'log_return': log_returns, 'price': prices, 'sigma': sigma}
+
+    def iter_chunks(self, chunk_size: int, dtype=np.float32) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Yield the series in contiguous blocks of at most chunk_size steps, without
+        ever holding n_steps worth of data, a DatetimeIndex or a DataFrame.
+
+        Each block is a dict of 'log_return', 'price', 'sigma' arrays in dtype.
+        The sigma recursion and cumulative log-price are carried across block
+        boundaries in float64. eps and eta come from two child streams spawned
+        off this generator's rng, so the concatenated output does not depend on
+        chunk_size (it is a different draw from generate()).
+        """
+        chunk_size = int(chunk_size)
+        eps_rng, eta_rng = self.rng.spawn(2)
+        sqrt_dt = np.sqrt(self.dt)
+        log_price = np.log(100.0)
+        last_sigma = None
+
+        for start in range(0, self.n_steps, chunk_size):
+            m = min(chunk_size, self.n_steps - start)
+            eps = eps_rng.standard_normal(m)
+            eta = eta_rng.normal(scale = self.xi, size = m)
+
+            first = self.sigma0 if last_sigma is None else self.alpha + self.beta * last_sigma + eta[0]
+            raw_sigma = ar1_sigma(self.alpha, self.beta, first, eta)
+            last_sigma = raw_sigma[-1]
+            sigma = np.abs(raw_sigma)
+
+            log_returns = self.mu * self.dt + sigma * sqrt_dt * eps
+            cum = log_price + np.cumsum(log_returns)
+            log_price = cum[-1]
+
+            yield {'log_return': log_returns.astype(dtype, copy=False),
+                   'price': np.exp(cum).astype(dtype, copy=False),
+                   'sigma': sigma.astype(dtype, copy=False)}
@@ -1,6 +1,7 @@
 # src/quantpkg/features.py
+import numpy as np
 import pandas as pd
-from typing import Any
+from typing import Any, Tuple
 
 class FeatureEngineer:
     """
@@ -16,3 +17,108 @@ class FeatureEngineer:
         out["zscore"] = (out["log_return"] - out["roll_mean"]) / out["roll_std"]
         # keep consistent names
         return out
+
+
+def rolling_moments(x: np.ndarray, window: int, mean_out: np.ndarray = None,
+                    std_out: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and std (ddof=1) of a finite 1-d array via centred cumulative sums.
+    Writes into mean_out / std_out when given; the first window-1 entries are NaN,
+    as with pandas rolling(window).
+    """
+    x = np.asarray(x, dtype=float)
+    n, w = len(x), int(window)
+    mean_out = np.empty(n) if mean_out is None else mean_out
+    std_out = np.empty(n) if std_out is None else std_out
+    mean_out[:w - 1] = np.nan
+    std_out[:w - 1] = np.nan
+    if n < w:
+        return mean_out, std_out
+
+    # centring on the first window keeps the running sums small
+    c = x[:w].mean()
+    buf = np.empty(n + 1)
+    buf[0] = 0.0
+    m = mean_out[w - 1:]
+    s = std_out[w - 1:]
+
+    np.subtract(x, c, out=buf[1:])
+    np.cumsum(buf, out=buf)
+    np.subtract(buf[w:], buf[:-w], out=m)
+    m /= w
+
+    np.subtract(x, c, out=buf[1:])
+    np.square(buf[1:], out=buf[1:])
+    np.cumsum(buf, out=buf)
+    np.subtract(buf[w:], buf[:-w], out=s)
+    # sum of squares about the window mean: S2 - w * m^2
+    s -= w * m * m
+    np.maximum(s, 0.0, out=s)
+    s /= (w - 1)
+    np.sqrt(s, out=s)
+
+    m += c
+    return mean_out, std_out
+
+
+class StreamingFeatureEngineer:
+    """
+    Tick-by-tick version of FeatureEngineer.
+
+    Keeps the last `window` returns in a ring buffer with a running mean and
+    sum of squared deviations (Welford-style add/remove updates), so each
+    update is O(1). The moments are re-synced from the buffer once per
+    window to stop rounding drift accumulating on long streams, and whenever
+    a NaN enters or leaves it, so a missing return only blanks the windows
+    that contain it, as with pandas rolling.
+    """
+    def __init__(self, window: int):
+        self.window = int(window)
+        self.reset()
+
+    def reset(self):
+        self._buf = np.zeros(self.window)
+        self._pos = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        return self
+
+    def from_history(self, df: pd.DataFrame):
+        """Warm start from the tail of df['log_return']; returns self."""
+        self.reset()
+        for r in df["log_return"].to_numpy()[-self.window:]:
+            self.update(r)
+        return self
+
+    def update(self, log_return: float) -> Tuple[float, float, float]:
+        """Push one return; returns (roll_mean, roll_std, zscore), NaN until the window is full."""
+        x = float(log_return)
+        w = self.window
+        if self._count < w:
+            old = 0.0
+            self._count += 1
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        else:
+            old = self._buf[self._pos]
+            old_mean = self._mean
+            self._mean += (x - old) / w
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+        self._buf[self._pos] = x
+        self._pos = (self._pos + 1) % w
+        if np.isnan(x) or np.isnan(old):
+            filled = self._buf[:self._count]
+            self._mean = float(filled.mean())
+            self._m2 = float(((filled - self._mean) ** 2).sum())
+
+        if self._count < w:
+            return np.nan, np.nan, np.nan
+        if self._pos == 0:
+            self._mean = float(self._buf.mean())
+            self._m2 = float(((self._buf - self._mean) ** 2).sum())
+
+        std = np.sqrt(max(self._m2, 0.0) / (w - 1)) if w > 1 else np.nan
+        z = (x - self._mean) / std if std > 0 else np.nan
+        return self._mean, std, z
@@ -0,0 +1,56 @@
+# src/quantpkg/montecarlo.py
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Optional
+from .config import Config
+from .data import DataGenerator
+from .pipeline import run_arrays
+
+def _run_chunk(cfg: dict, seeds: List[np.random.SeedSequence]) -> np.ndarray:
+    """Simulate and backtest one batch of seeds; returns an (n, 3) array of mean/vol/sharpe."""
+    out = np.empty((len(seeds), 3))
+    for i, ss in enumerate(seeds):
+        gen = DataGenerator(mu=cfg["mu"], alpha=cfg["alpha"], beta=cfg["beta"], xi=cfg["xi"],
+                            sigma0=cfg["sigma0"], dt=cfg["dt"], n_steps=cfg["n_steps"], seed=ss)
+        r = gen.simulate(1)["log_return"][0]
+        stats = run_arrays(r, window=cfg["window"], theta=cfg["theta"],
+                           initial_capital=cfg["initial_capital"],
+                           freq_per_year=cfg["freq_per_year"])["stats"]
+        out[i] = stats["mean_return"], stats["volatility"], stats["sharpe"]
+    return out
+
+def run_seeds(config: Config, n_seeds: int, n_workers: Optional[int] = None,
+              chunk_size: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Sampling distribution of the z-score strategy's stats across seeds.
+
+    config.seed is the root of a SeedSequence; seed i uses its i-th spawned
+    child, so results depend only on (config, n_seeds) and not on n_workers
+    or chunk_size. Seeds are sent to the pool in chunks to keep per-task
+    overhead low; n_workers defaults to os.cpu_count() and n_workers=1
+    runs in-process.
+
+    Returns {"sharpe", "volatility", "mean_return"} arrays of length n_seeds,
+    in seed order.
+    """
+    n_seeds = int(n_seeds)
+    cfg = asdict(config)
+    children = np.random.SeedSequence(config.seed).spawn(n_seeds)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        # ~4 chunks per worker balances load without flooding the queue
+        chunk_size = max(1, -(-n_seeds // (4 * n_workers)))
+    chunks = [children[i:i + chunk_size] for i in range(0, n_seeds, chunk_size)]
+
+    if n_workers == 1:
+        parts = [_run_chunk(cfg, c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            parts = list(pool.map(_run_chunk, [cfg] * len(chunks), chunks))
+
+    res = np.concatenate(parts) if parts else np.empty((0, 3))
+    return {"sharpe": res[:, 2], "volatility": res[:, 1], "mean_return": res[:, 0]}
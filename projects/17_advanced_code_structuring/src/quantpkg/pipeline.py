@@ -0,0 +1,118 @@
+# src/quantpkg/pipeline.py
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable
+from .features import rolling_moments
+
+def run_arrays(log_return: np.ndarray, window: int, theta: float = 1.0,
+               initial_capital: float = 1e5, freq_per_year: int = 252,
+               index=None) -> Dict[str, Any]:
+    """
+    Fused FeatureEngineer -> Strategy -> Backtester on NumPy buffers.
+
+    Same rules as the DataFrame path (rolling z-score, long below -theta,
+    short above theta, position lagged one step, wealth = cumprod(1 + ret)),
+    but every intermediate lives in one preallocated array and pandas is only
+    used to wrap the results at the end. log_return must be finite.
+
+    Returns {"df": DataFrame, "stats": dict}, like Backtester.run.
+    """
+    r = np.ascontiguousarray(log_return, dtype=float)
+    n = len(r)
+
+    roll_mean = np.empty(n)
+    roll_std = np.empty(n)
+    zscore = np.empty(n)
+    position = np.zeros(n, dtype=np.int64)
+    strategy_ret = np.empty(n)
+    wealth = np.empty(n)
+
+    # --- features ---
+    rolling_moments(r, window, mean_out=roll_mean, std_out=roll_std)
+    np.subtract(r, roll_mean, out=zscore)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(zscore, roll_std, out=zscore)
+
+    # --- strategy (NaN compares False, so warm-up stays flat) ---
+    position[zscore < -theta] = 1
+    position[zscore > theta] = -1
+
+    # --- backtest ---
+    strategy_ret[0] = 0.0
+    np.multiply(position[:-1], r[1:], out=strategy_ret[1:])
+    np.add(strategy_ret, 1.0, out=wealth)
+    np.cumprod(wealth, out=wealth)
+    wealth *= initial_capital
+
+    mean = strategy_ret.mean()
+    vol = strategy_ret.std(ddof=1) if n > 1 else np.nan
+    sharpe = (mean / vol) * np.sqrt(freq_per_year) if vol > 0 else np.nan
+    stats = {"mean_return": float(mean), "volatility": float(vol), "sharpe": float(sharpe)}
+
+    df = pd.DataFrame({
+        "log_return": r,
+        "roll_mean": roll_mean,
+        "roll_std": roll_std,
+        "zscore": zscore,
+        "position": position,
+        "strategy_ret": strategy_ret,
+        "wealth": wealth,
+    }, index=index, copy=False)
+    return {"df": df, "stats": stats}
+
+
+def run_chunks(chunks: Iterable, window: int, theta: float = 1.0,
+               initial_capital: float = 1e5, freq_per_year: int = 252) -> Dict[str, Any]:
+    """
+    Streaming counterpart of run_arrays for series too long to hold in memory.
+
+    chunks yields consecutive log-return blocks (arrays, or the dicts from
+    DataGenerator.iter_chunks). The last window-1 returns, the last position
+    and the wealth level are carried across block boundaries, and mean/vol
+    are merged per block (Chan et al. pairwise update), so the stats equal
+    run_arrays on the concatenated series.
+
+    Returns {"stats": dict, "final_wealth": float, "n_obs": int}.
+    """
+    w = int(window)
+    tail = np.empty(0)
+    last_pos = 0
+    wealth = float(initial_capital)
+    n, mean, m2 = 0, 0.0, 0.0
+
+    for chunk in chunks:
+        if isinstance(chunk, dict):
+            chunk = chunk["log_return"]
+        r = np.asarray(chunk, dtype=float)
+        if len(r) == 0:
+            continue
+        ext = np.concatenate((tail, r))
+        roll_mean, roll_std = rolling_moments(ext, w)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = ((ext - roll_mean) / roll_std)[len(tail):]
+
+        position = np.zeros(len(r), dtype=np.int64)
+        position[z < -theta] = 1
+        position[z > theta] = -1
+
+        strategy_ret = np.empty(len(r))
+        strategy_ret[0] = last_pos * r[0] if n > 0 else 0.0
+        np.multiply(position[:-1], r[1:], out=strategy_ret[1:])
+        wealth *= float(np.prod(1.0 + strategy_ret))
+
+        k = len(r)
+        k_mean = strategy_ret.mean()
+        k_m2 = ((strategy_ret - k_mean) ** 2).sum()
+        delta = k_mean - mean
+        total = n + k
+        mean += delta * k / total
+        m2 += k_m2 + delta * delta * n * k / total
+        n = total
+
+        last_pos = position[-1]
+        tail = ext[-(w - 1):] if w > 1 else np.empty(0)
+
+    vol = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    sharpe = (mean / vol) * np.sqrt(freq_per_year) if vol > 0 else np.nan
+    stats = {"mean_return": float(mean), "volatility": float(vol), "sharpe": float(sharpe)}
+    return {"stats": stats, "final_wealth": wealth, "n_obs": n}
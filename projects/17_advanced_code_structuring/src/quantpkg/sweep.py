@@ -0,0 +1,75 @@
+# src/quantpkg/sweep.py
+import numpy as np
+import pandas as pd
+from typing import Iterable, Tuple
+from .features import rolling_moments
+
+def sweep(log_return: np.ndarray, windows: Iterable[int], thetas: Iterable[float],
+          freq_per_year: int = 252) -> pd.DataFrame:
+    """
+    Evaluate the z-score strategy over a full window x theta grid in one pass.
+
+    Rolling moments are computed once per window. For a fixed window the
+    strategy return at t+1 is +r_{t+1} when z_t < -theta, -r_{t+1} when
+    z_t > theta and 0 otherwise. Bucketing each z_t by how many (sorted)
+    thetas |z_t| clears and taking suffix sums of the bucketed r_{t+1} and
+    r_{t+1}^2 gives the return sum and sum of squares for every theta at
+    once, without materialising an (n_theta, T) position matrix. Stats
+    follow Backtester.run (ddof=1 vol, annualised Sharpe). log_return must
+    be finite.
+
+    Returns a tidy DataFrame with columns
+    ['window', 'theta', 'mean_return', 'volatility', 'sharpe'].
+    """
+    r = np.ascontiguousarray(log_return, dtype=float)
+    thetas = np.asarray(list(thetas), dtype=float)
+    if (thetas < 0).any():
+        raise ValueError("thetas must be non-negative.")
+    n = len(r)
+    rows = []
+    for w in windows:
+        mean, std = rolling_moments(r, w)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (r - mean) / std
+        m, vol, sharpe = theta_stats(z[:-1], r[1:], thetas, n, freq_per_year)
+        rows.append(pd.DataFrame({
+            "window": int(w),
+            "theta": thetas,
+            "mean_return": m,
+            "volatility": vol,
+            "sharpe": sharpe,
+        }))
+    return pd.concat(rows, ignore_index=True)
+
+def theta_stats(z: np.ndarray, y: np.ndarray, thetas: np.ndarray, n: int,
+                freq_per_year: int = 252) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean, vol and Sharpe of the strategy for every theta, given z_t and the
+    return it earns y_t = r_{t+1}. n is the length of the backtest (the
+    first strategy return is always 0, so n = len(y) + 1 for a full series).
+    """
+    thetas = np.asarray(thetas, dtype=float)
+    k = len(thetas)
+    order = np.argsort(thetas)
+    valid = ~np.isnan(z)
+    zv = z[valid]
+    yv = y[valid]
+
+    # thetas are non-negative, so z_t clears theta_j (long if z_t < 0,
+    # short if z_t > 0) exactly when theta_j < |z_t|
+    n_clear = np.searchsorted(thetas[order], np.abs(zv), side="left")
+
+    def suffix(weights):
+        b = np.bincount(n_clear, weights=weights, minlength=k + 1)
+        return np.cumsum(b[::-1])[::-1][1:]
+
+    total = np.empty(k)
+    sq = np.empty(k)
+    total[order] = suffix(-np.sign(zv) * yv)
+    sq[order] = suffix(yv * yv)
+
+    m = total / n
+    vol = np.sqrt(np.maximum(sq - n * m * m, 0.0) / (n - 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(vol > 0, m / vol * np.sqrt(freq_per_year), np.nan)
+    return m, vol, sharpe
@@ -0,0 +1,32 @@
+# tests/test_backtest.py
+import numpy as np
+import pandas as pd
+from quantpkg.backtest import Backtester
+
+def test_run_panel_matches_single_asset_runs():
+    rng = np.random.default_rng(7)
+    r = rng.normal(scale=0.01, size=(300, 4))
+    pos = rng.integers(-1, 2, size=(300, 4))
+    bt = Backtester()
+    res = bt.run_panel(r, pos)
+    for j in range(4):
+        single = bt.run(pd.DataFrame({'log_return': r[:, j], 'position': pos[:, j]}))
+        np.testing.assert_allclose(res['nav'][:, j], single['df']['wealth'], rtol=1e-12)
+        assert abs(res['asset_stats']['sharpe'][j] - single['stats']['sharpe']) < 1e-10
+    np.testing.assert_allclose(res['portfolio_returns'], res['returns'].mean(axis=1))
+
+def test_run_panel_costs_and_float32():
+    r = np.zeros((4, 1))
+    pos = np.array([[1], [1], [-1], [0]])
+    res = Backtester().run_panel(r, pos, cost_bps=10)
+    # trades take effect one bar later: 0 -> 1 at t=1, 1 -> -1 at t=3
+    np.testing.assert_allclose(res['turnover'][:, 0], [0, 1, 0, 2])
+    np.testing.assert_allclose(res['returns'][:, 0], [0, -1e-3, 0, -2e-3])
+
+    rng = np.random.default_rng(1)
+    r = rng.normal(scale=0.01, size=(200, 3))
+    pos = rng.integers(-1, 2, size=(200, 3))
+    r64 = Backtester().run_panel(r, pos, cost_bps=5)
+    r32 = Backtester().run_panel(r, pos, cost_bps=5, dtype=np.float32)
+    assert r32['returns'].dtype == np.float32
+    np.testing.assert_allclose(r32['asset_stats']['sharpe'], r64['asset_stats']['sharpe'], rtol=1e-4)
@@ -0,0 +1,50 @@
+# tests/test_cache.py
+import numpy as np
+import pandas as pd
+from quantpkg.cache import DataCache, config_key
+from quantpkg.config import Config
+
+def test_cache_hit_matches_generate(tmp_path):
+    cache = DataCache(tmp_path)
+    cfg = Config(n_steps=200, seed=9)
+    first = cache.generate(cfg)
+    assert cache.path(cfg).exists()
+    second = cache.generate(cfg)
+    np.testing.assert_array_equal(first.values, second.values)
+    assert (first.index == second.index).all()
+    # strategy-only fields do not change the key
+    assert config_key(cfg) == config_key(Config(n_steps=200, seed=9, window=50))
+    assert config_key(cfg) != config_key(Config(n_steps=200, seed=10))
+
+def test_cache_lru_eviction(tmp_path):
+    cfgs = [Config(n_steps=1000, seed=s) for s in range(3)]
+    cache = DataCache(tmp_path, max_bytes=2 * 1000 * 4 * 8 + 2000)
+    cache.generate(cfgs[0])
+    cache.generate(cfgs[1])
+    cache.generate(cfgs[0])
+    cache.generate(cfgs[2])
+    assert cache.path(cfgs[0]).exists()
+    assert not cache.path(cfgs[1]).exists()
+    assert cache.path(cfgs[2]).exists()
+
+def test_cache_skips_unseeded_configs(tmp_path):
+    cache = DataCache(tmp_path)
+    cfg = Config(n_steps=200, seed=None)
+    first = cache.generate(cfg)
+    second = cache.generate(cfg)
+    assert not cache.path(cfg).exists()
+    assert not np.array_equal(first.values, second.values)
+
+def test_cache_hit_does_not_rebuild_the_calendar(tmp_path, monkeypatch):
+    cache = DataCache(tmp_path)
+    cfg = Config(n_steps=200, seed=9)
+    first = cache.generate(cfg, start_date="2021-06-01")
+
+    def no_date_range(*args, **kwargs):
+        raise AssertionError("cache hit called pd.date_range")
+    monkeypatch.setattr(pd, "date_range", no_date_range)
+    second = cache.generate(cfg, start_date="2021-06-01")
+    np.testing.assert_array_equal(first.values, second.values)
+    assert (first.index == second.index).all()
+    # the index is part of the key
+    assert cache.path(cfg, start_date="2021-06-01") != cache.path(cfg)
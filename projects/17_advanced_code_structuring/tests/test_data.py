@@ -1,5 +1,6 @@
 # tests/test_data.py
 from quantpkg.data import DataGenerator
+import numpy as np
 import pandas as pd
 
 def test_generate_no_nans_and_length():
@@ -7,3 +8,26 @@ def test_generate_no_nans_and_length():
     df = gen.generate()
     assert len(df) == 100
     assert not df.isna().any().any()
+
+def test_generate_paths_matches_single_path():
+    kw = dict(mu=0.0, alpha=0.01, beta=0.9, xi=0.001, sigma0=0.01, dt=1/252, n_steps=250, seed=3)
+    single = DataGenerator(**kw)
+    first, second = single.generate(), single.generate()
+    paths = DataGenerator(**kw).generate_paths(2)
+    assert paths['sigma'].shape == (2, 250)
+    arrays = DataGenerator(**kw).simulate(2)
+    assert 'index' not in arrays
+    np.testing.assert_array_equal(arrays['log_return'], paths['log_return'])
+    for i, df in enumerate([first, second]):
+        assert (paths['log_return'][i] == df['log_return'].values).all()
+        assert (paths['price'][i] == df['price'].values).all()
+        assert (paths['sigma'][i] == df['sigma'].values).all()
+
+def test_iter_chunks_independent_of_chunk_size():
+    kw = dict(mu=0.0, alpha=0.01, beta=0.9, xi=0.001, sigma0=0.01, dt=1/252, n_steps=1000, seed=5)
+    big = list(DataGenerator(**kw).iter_chunks(1000, dtype=np.float64))
+    small = list(DataGenerator(**kw).iter_chunks(64, dtype=np.float64))
+    assert len(big) == 1 and len(small) == 16
+    for col in ['log_return', 'price', 'sigma']:
+        np.testing.assert_allclose(np.concatenate([c[col] for c in small]), big[0][col], rtol=1e-12)
+    assert next(DataGenerator(**kw).iter_chunks(64))['price'].dtype == np.float32
@@ -1,7 +1,7 @@
 # tests/test_features.py
 import numpy as np
 import pandas as pd
-from quantpkg.features import FeatureEngineer
+from quantpkg.features import FeatureEngineer, StreamingFeatureEngineer
 
 def test_rolling_mean_matches():
     rng = np.random.default_rng(0)
@@ -13,3 +13,26 @@ def test_rolling_mean_matches():
     expected = pd.Series(r).rolling(5).mean().values
     # compare one valid entry
     assert abs(out['roll_mean'].dropna().iloc[0] - expected[4]) < 1e-12
+
+def test_streaming_matches_batch():
+    rng = np.random.default_rng(1)
+    r = rng.normal(scale=0.01, size=300) + 0.05
+    df = pd.DataFrame({'log_return': r})
+    batch = FeatureEngineer(window=20).add_rolling_features(df)
+    sfe = StreamingFeatureEngineer(window=20)
+    stream = np.array([sfe.update(x) for x in r])
+    expected = batch[['roll_mean', 'roll_std', 'zscore']].values
+    np.testing.assert_allclose(stream[19:], expected[19:], rtol=1e-9, atol=1e-12)
+    assert np.isnan(stream[:19]).all()
+
+    warm = StreamingFeatureEngineer(window=20).from_history(df.iloc[:200])
+    np.testing.assert_allclose([warm.update(x) for x in r[200:]], expected[200:], rtol=1e-9, atol=1e-12)
+
+    # a missing return blanks only the windows that contain it
+    r[33] = np.nan
+    batch = FeatureEngineer(window=20).add_rolling_features(pd.DataFrame({'log_return': r}))
+    sfe = StreamingFeatureEngineer(window=20)
+    stream = np.array([sfe.update(x) for x in r])
+    expected = batch[['roll_mean', 'roll_std', 'zscore']].values
+    np.testing.assert_allclose(stream[19:], expected[19:], rtol=1e-9, atol=1e-12)
+    assert np.isnan(stream[33:53]).all() and not np.isnan(stream[53:]).any()
@@ -0,0 +1,13 @@
+# tests/test_montecarlo.py
+import numpy as np
+from quantpkg.config import Config
+from quantpkg.montecarlo import run_seeds
+
+def test_run_seeds_independent_of_workers():
+    cfg = Config(n_steps=300, seed=11)
+    serial = run_seeds(cfg, n_seeds=12, n_workers=1)
+    parallel = run_seeds(cfg, n_seeds=12, n_workers=2, chunk_size=5)
+    assert serial["sharpe"].shape == (12,)
+    for k in serial:
+        np.testing.assert_array_equal(serial[k], parallel[k])
+    assert len(np.unique(serial["sharpe"])) > 1
@@ -0,0 +1,34 @@
+# tests/test_pipeline.py
+import numpy as np
+from quantpkg.data import DataGenerator
+from quantpkg.features import FeatureEngineer
+from quantpkg.strategy import Strategy
+from quantpkg.backtest import Backtester
+from quantpkg.pipeline import run_arrays, run_chunks
+
+def test_run_arrays_matches_dataframe_pipeline():
+    gen = DataGenerator(mu=0.0, alpha=0.01, beta=0.95, xi=0.002, sigma0=0.01, dt=1/252, n_steps=1000, seed=4)
+    df = gen.generate()
+    df = FeatureEngineer(window=20).add_rolling_features(df)
+    df = Strategy(theta=1.0).generate_positions(df)
+    expected = Backtester().run(df)
+
+    res = run_arrays(df['log_return'].values, window=20, theta=1.0, index=df.index)
+    out = res['df']
+    np.testing.assert_allclose(out['roll_mean'], df['roll_mean'], rtol=1e-8, atol=1e-12)
+    np.testing.assert_allclose(out['zscore'], df['zscore'], rtol=1e-6, atol=1e-9)
+    assert (out['position'].values == df['position'].values).all()
+    np.testing.assert_allclose(out['wealth'], expected['df']['wealth'], rtol=1e-10)
+    for k, v in expected['stats'].items():
+        assert abs(res['stats'][k] - v) < 1e-10
+
+def test_run_chunks_matches_run_arrays():
+    gen = DataGenerator(mu=0.0, alpha=0.01, beta=0.95, xi=0.002, sigma0=0.01, dt=1/252, n_steps=3000, seed=8)
+    chunks = list(gen.iter_chunks(250, dtype=np.float64))
+    r = np.concatenate([c['log_return'] for c in chunks])
+    expected = run_arrays(r, window=30, theta=1.0)
+    res = run_chunks(iter(chunks), window=30, theta=1.0)
+    assert res['n_obs'] == 3000
+    assert abs(res['final_wealth'] - expected['df']['wealth'].iloc[-1]) < 1e-6
+    for k, v in expected['stats'].items():
+        assert abs(res['stats'][k] - v) < 1e-9
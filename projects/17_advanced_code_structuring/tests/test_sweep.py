@@ -0,0 +1,17 @@
+# tests/test_sweep.py
+import numpy as np
+from quantpkg.pipeline import run_arrays
+from quantpkg.sweep import sweep
+
+def test_sweep_matches_single_runs():
+    r = np.random.default_rng(5).normal(scale=0.01, size=2000)
+    windows, thetas = [10, 20, 45], [1.0, 0.0, 1.7, 0.5, 6.0]
+    grid = sweep(r, windows, thetas)
+    assert len(grid) == len(windows) * len(thetas)
+    for row in grid.itertuples():
+        stats = run_arrays(r, window=row.window, theta=row.theta)["stats"]
+        np.testing.assert_allclose(
+            [row.mean_return, row.volatility, row.sharpe],
+            [stats["mean_return"], stats["volatility"], stats["sharpe"]],
+            rtol=1e-9, atol=1e-12,
+        )
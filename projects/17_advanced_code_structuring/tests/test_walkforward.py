@@ -0,0 +1,40 @@
+# tests/test_walkforward.py
+import numpy as np
+import pandas as pd
+from quantpkg.features import FeatureEngineer
+from quantpkg.strategy import Strategy
+from quantpkg.backtest import Backtester
+from quantpkg.sweep import sweep
+from quantpkg.walkforward import walk_forward
+
+def test_walk_forward_folds_and_stitching():
+    rng = np.random.default_rng(3)
+    idx = pd.date_range('2020-01-01', periods=1200, freq='B')
+    r = pd.Series(rng.normal(scale=0.01, size=1200), index=idx)
+    windows, thetas = [10, 30], [0.5, 1.0, 1.5]
+    res = walk_forward(r, windows, thetas, train_size=400, test_size=200, n_workers=1)
+
+    folds = res['folds']
+    assert len(folds) == 4
+    assert len(res['nav']) == 800
+    assert res['nav'].index[0] == idx[400]
+    assert {'calibrate_s', 'evaluate_s'} <= set(folds.columns)
+
+    # first fold: chosen params are the in-sample sweep optimum
+    grid = sweep(r.values[:400], windows, thetas)
+    best = grid.loc[grid['sharpe'].idxmax()]
+    assert folds.loc[0, 'window'] == best['window'] and folds.loc[0, 'theta'] == best['theta']
+
+    # and its OOS returns match the DataFrame pipeline over the full history
+    df = FeatureEngineer(window=int(best['window'])).add_rolling_features(r.to_frame('log_return'))
+    df = Strategy(theta=best['theta']).generate_positions(df)
+    full = Backtester().run(df)['df']['strategy_ret']
+    np.testing.assert_allclose(res['oos_returns'].iloc[:200], full.iloc[400:600], atol=1e-12)
+
+    # per-fold OOS Sharpe is the Sharpe of that fold's stitched test segment
+    for k in folds.index:
+        seg = res['oos_returns'].iloc[200 * k:200 * (k + 1)]
+        assert abs(folds.loc[k, 'oos_sharpe'] - seg.mean() / seg.std(ddof=1) * np.sqrt(252)) < 1e-12
+
+    parallel = walk_forward(r, windows, thetas, train_size=400, test_size=200, n_workers=2)
+    np.testing.assert_array_equal(parallel['oos_returns'].values, res['oos_returns'].values)
@@ -1,2 +1,2 @@
 # __init__.py
-__all__ = ["data", "factors", "standardise", "strategy", "backtest", "utils", "experiment"]
\ No newline at end of file
+__all__ = ["data", "factors", "standardise", "strategy", "backtest", "utils", "experiment", "grid", "book", "analytics"]
\ No newline at end of file
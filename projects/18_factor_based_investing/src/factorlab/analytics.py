@@ -0,0 +1,83 @@
+# --- src/factorlab/analytics.py ---
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+def forward_returns(ret_df: pd.DataFrame, horizon: int) -> pd.DataFrame:
+    """
+    Sum of log-returns over t+1..t+horizon, stored at t (NaN if any is missing
+    or the window runs past the end).
+    """
+    r = ret_df.to_numpy(dtype=float)
+    n, h = r.shape[0], int(horizon)
+    nan = np.isnan(r)
+    c = np.vstack([np.zeros((1, r.shape[1])), np.cumsum(np.where(nan, 0.0, r), axis=0)])
+    cn = np.vstack([np.zeros((1, r.shape[1]), dtype=np.int64), np.cumsum(nan, axis=0)])
+    out = np.full(r.shape, np.nan)
+    if h < n:
+        # rows t = 0..n-h-1 cover returns t+1..t+h
+        out[:n - h] = c[h + 1:] - c[1:n - h + 1]
+        out[:n - h][(cn[h + 1:] - cn[1:n - h + 1]) > 0] = np.nan
+    return pd.DataFrame(out, index=ret_df.index, columns=ret_df.columns)
+
+def _row_corr(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pearson correlation of each row pair over the columns where both are non-NaN."""
+    valid = ~(np.isnan(a) | np.isnan(b))
+    n = valid.sum(axis=1)
+    a = np.where(valid, a, 0.0)
+    b = np.where(valid, b, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(valid, a - a.sum(axis=1, keepdims=True) / n[:, None], 0.0)
+        b = np.where(valid, b - b.sum(axis=1, keepdims=True) / n[:, None], 0.0)
+        corr = (a * b).sum(axis=1) / np.sqrt((a * a).sum(axis=1) * (b * b).sum(axis=1))
+    corr[n < 3] = np.nan
+    return corr
+
+def rank_ic(scores: pd.DataFrame, ret_df: pd.DataFrame, horizons: Iterable[int] = (1,)) -> pd.DataFrame:
+    """
+    Cross-sectional Spearman rank IC between scores at t and forward returns
+    over t+1..t+h, for every date and horizon at once (dates x horizons).
+    Each date only uses assets with both a score and a forward return, and
+    both sides are ranked on that common set.
+    """
+    ret_df = ret_df.reindex(index=scores.index, columns=scores.columns)
+    s = scores.to_numpy(dtype=float)
+    out = {}
+    for h in horizons:
+        f = forward_returns(ret_df, h).to_numpy()
+        both = ~(np.isnan(s) | np.isnan(f))
+        rs = pd.DataFrame(np.where(both, s, np.nan)).rank(axis=1).to_numpy()
+        rf = pd.DataFrame(np.where(both, f, np.nan)).rank(axis=1).to_numpy()
+        out[int(h)] = _row_corr(rs, rf)
+    ic = pd.DataFrame(out, index=scores.index)
+    ic.columns.name = "horizon"
+    return ic
+
+def ic_summary(ic: pd.DataFrame) -> pd.DataFrame:
+    """IC decay table: mean, std, IR and t-stat of the IC per horizon."""
+    mean = ic.mean()
+    std = ic.std(ddof=1)
+    n = ic.notna().sum()
+    return pd.DataFrame({
+        "mean_ic": mean,
+        "std_ic": std,
+        "ir": mean / std,
+        "t_stat": mean / std * np.sqrt(n),
+        "n_dates": n,
+    })
+
+def factor_turnover(scores: pd.DataFrame, lag: int = 1) -> pd.Series:
+    """
+    Factor turnover as 1 - rank autocorrelation of the cross-section between
+    t - lag and t (0 = identical ordering, 1 = unrelated, 2 = reversed).
+    """
+    ranks = scores.rank(axis=1).to_numpy(dtype=float)
+    prev = np.full(ranks.shape, np.nan)
+    prev[lag:] = ranks[:-lag]
+    # re-rank on the assets present on both dates
+    both = ~(np.isnan(ranks) | np.isnan(prev))
+    cur = pd.DataFrame(np.where(both, ranks, np.nan)).rank(axis=1).to_numpy()
+    prev = pd.DataFrame(np.where(both, prev, np.nan)).rank(axis=1).to_numpy()
+    return pd.Series(1.0 - _row_corr(cur, prev), index=scores.index, name="turnover")
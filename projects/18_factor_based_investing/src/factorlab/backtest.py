@@ -3,6 +3,8 @@
 import pandas as pd
 import numpy as np
 
+from factorlab.sparse import SparseWeights
+
 class Backtester:
     def __init__(self, freq_per_year = 252, initial_capital = 1e5):
         self.freq = freq_per_year
@@ -11,13 +13,50 @@ class Backtester:
     def run(self, returns_df, weights_df):
         w_lag = weights_df.shift(1).fillna(0)
         port_ret = (w_lag * returns_df).sum(axis = 1)
+        turnover = weights_df.fillna(0).diff().abs().sum(axis = 1)
+        turnover.iloc[:1] = weights_df.iloc[:1].abs().sum(axis = 1)
+        return self._summarise(port_ret, turnover)
+
+    def run_sparse(self, returns_df, weights: SparseWeights):
+        """
+        Same as run for CSR weights: portfolio returns and turnover are
+        computed from the stored entries only, in O(nnz) work and memory.
+        """
+        # entries are addressed by position, so line returns up with the weights
+        # by label first (as run's alignment does; missing labels earn nothing)
+        r = returns_df.reindex(index = weights.index, columns = weights.columns).to_numpy(dtype = float)
+        n = len(weights.index)
+        rows = weights.row_ids()
+
+        # weights of date t earn the returns of date t+1
+        live = rows < n - 1
+        contrib = weights.values[live] * r[rows[live] + 1, weights.indices[live]]
+        contrib = np.nan_to_num(contrib)
+        port_ret = np.zeros(n)
+        port_ret[1:] = np.bincount(rows[live], weights = contrib, minlength = n)[:n - 1]
+
+        # turnover_t = sum |w_t - w_{t-1}|: both sides' |w|, corrected on assets held on both dates
+        n_assets = len(weights.columns)
+        key = rows * n_assets + weights.indices
+        prev_key = (rows + 1) * n_assets + weights.indices
+        _, cur, prev = np.intersect1d(key, prev_key, assume_unique = True, return_indices = True)
+        absw = np.abs(weights.values)
+        gross = np.bincount(rows, weights = absw, minlength = n)
+        turnover = gross.copy()
+        turnover[1:] += gross[:n - 1]
+        both = absw[cur] + absw[prev] - np.abs(weights.values[cur] - weights.values[prev])
+        turnover -= np.bincount(rows[cur], weights = both, minlength = n)
+
+        return self._summarise(pd.Series(port_ret, index = weights.index),
+                               pd.Series(turnover, index = weights.index))
 
+    def _summarise(self, port_ret, turnover):
         nav = (1 + port_ret).cumprod() * self.capital
         mean = port_ret.mean()
         vol = port_ret.std(ddof = 1)
         sharpe = (mean / vol) * np.sqrt(self.freq) if vol > 0 else np.nan
 
-        return {"returns": port_ret, "nav": nav, "stats": {
+        return {"returns": port_ret, "nav": nav, "turnover": turnover, "stats": {
             "mean_return": float(mean),
             "volatility": float(vol),
             "sharpe": float(sharpe)
@@ -0,0 +1,122 @@
+# --- src/factorlab/book.py ---
+
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from factorlab.strategy import TopKStrategy
+
+def _zscore_row(x: np.ndarray) -> np.ndarray:
+    """Cross-sectional z-score of one row, NaN-skipping like zscore_df."""
+    valid = ~np.isnan(x)
+    if valid.sum() < 2:
+        return np.full(x.shape, np.nan)
+    v = x[valid]
+    return (x - v.mean()) / v.std(ddof=1)
+
+class FactorBook:
+    """
+    Incremental version of the Experiment pipeline for daily production use.
+
+    Keeps a (window, n_assets) ring buffer of returns with a running mean
+    and sum of squared deviations per asset (Welford add/remove updates,
+    re-synced from the buffer once per window), so append() costs O(N):
+    momentum, volatility and mean-reversion come straight from the running
+    moments, followed by the cross-sectional z-scores, the blended score and
+    TopKStrategy weights for that date. Missing returns are forward-filled
+    from the previous row (there is no future row to back-fill from); an
+    asset with no return yet (a late listing) scores NaN until it has a
+    full window of real data.
+    save()/load() checkpoint the full state to a single .npz file.
+    """
+    def __init__(self, columns: Sequence[str], window = 20, blend = (1.0, -0.5, 1.0),
+                 k_long = 2, k_short = 2):
+        self.columns = pd.Index(columns)
+        self.window = int(window)
+        self.blend = tuple(float(b) for b in blend)
+        self.strategy = TopKStrategy(k_long = k_long, k_short = k_short)
+        n = len(self.columns)
+        self._buf = np.zeros((self.window, n))
+        self._pos = 0
+        self._count = 0
+        self._mean = np.zeros(n)
+        self._m2 = np.zeros(n)
+        self._last = np.full(n, np.nan)
+        self.last_date = None
+
+    def append(self, date, returns_row) -> Tuple[pd.Series, pd.Series]:
+        """Add one date of returns; returns (scores, weights) for that date."""
+        if isinstance(returns_row, pd.Series):
+            returns_row = returns_row.reindex(self.columns)
+        x = np.asarray(returns_row, dtype=float).copy()
+        missing = np.isnan(x)
+        x[missing] = self._last[missing]
+        self._last = x
+
+        w = self.window
+        if self._count < w:
+            self._count += 1
+            old = np.zeros_like(x)
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        else:
+            old = self._buf[self._pos].copy()
+            old_mean = self._mean.copy()
+            self._mean += (x - old) / w
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+        self._buf[self._pos] = x
+        # a NaN (e.g. before a late listing's first return, which ffill can't
+        # fill) entering or leaving the window would stay in the running
+        # moments; recompute those columns from the buffer instead
+        stale = np.isnan(x) | np.isnan(old)
+        if stale.any():
+            filled = self._buf[:self._count, stale]
+            self._mean[stale] = filled.mean(axis=0)
+            self._m2[stale] = ((filled - self._mean[stale]) ** 2).sum(axis=0)
+        self._pos = (self._pos + 1) % w
+        if self._count == w and self._pos == 0:
+            self._mean = self._buf.mean(axis=0)
+            self._m2 = ((self._buf - self._mean) ** 2).sum(axis=0)
+        self.last_date = date
+
+        n = len(self.columns)
+        if self._count < w:
+            scores = np.full(n, np.nan)
+        else:
+            mean = self._mean
+            std = np.sqrt(np.maximum(self._m2, 0.0) / (w - 1))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mr = -(x - mean) / std
+                w_mom, w_vol, w_mr = self.blend
+                scores = w_mom * _zscore_row(mean) + w_vol * _zscore_row(std) + w_mr * _zscore_row(mr)
+
+        weights = self.strategy.allocate_array(scores[None, :])[0]
+        return (pd.Series(scores, index=self.columns, name=date),
+                pd.Series(weights, index=self.columns, name=date))
+
+    def save(self, path):
+        # write through a handle: np.savez(path) appends .npz, so load(path) would miss it
+        with open(path, "wb") as fh:
+            np.savez(fh, buf=self._buf, pos=self._pos, count=self._count, mean=self._mean,
+                     m2=self._m2, last=self._last, window=self.window, blend=np.array(self.blend),
+                     k=np.array([self.strategy.k_long, self.strategy.k_short]),
+                     columns=np.array(self.columns, dtype=str),
+                     last_date=np.array("" if self.last_date is None else str(self.last_date)))
+
+    @classmethod
+    def load(cls, path) -> "FactorBook":
+        with np.load(path, allow_pickle=False) as z:
+            k_long, k_short = (int(v) for v in z["k"])
+            book = cls(list(z["columns"]), window=int(z["window"]), blend=tuple(z["blend"]),
+                       k_long=k_long, k_short=k_short)
+            book._buf = z["buf"].copy()
+            book._pos = int(z["pos"])
+            book._count = int(z["count"])
+            book._mean = z["mean"].copy()
+            book._m2 = z["m2"].copy()
+            book._last = z["last"].copy()
+            last_date = str(z["last_date"])
+        book.last_date = pd.Timestamp(last_date) if last_date else None
+        return book
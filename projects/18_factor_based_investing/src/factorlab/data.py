@@ -56,3 +56,41 @@ class DataGenerator:
             assets[f"asset_{i+1}"] = df
 
         return assets
+
+    def generate_panel(self) -> Dict[str, pd.DataFrame]:
+        """
+        Simulate every asset at once as (n_steps, n_assets) arrays.
+
+        Same model as generate(), but each sigma step updates all assets in
+        one vector operation and the missing-data mask is applied in bulk.
+        Returns wide frames {"log_return", "price", "sigma"} with columns
+        asset_1..asset_N. The shocks are drawn as whole panels, so the sample
+        differs from generate() for the same seed.
+        """
+        cfg = self.cfg
+        n, m = cfg.n_steps, cfg.n_assets
+        dates = pd.date_range("2020-01-01", periods=n, freq="B")
+        cols = [f"asset_{i+1}" for i in range(m)]
+
+        eps = self.rng.standard_normal((n, m))
+        eta = self.rng.normal(scale=cfg.xi, size=(n, m))
+
+        sigma = np.empty((n, m))
+        sigma[0] = cfg.sigma0
+        for t in range(1, n):
+            np.multiply(sigma[t - 1], cfg.beta, out=sigma[t])
+            sigma[t] += cfg.alpha + eta[t]
+        np.abs(sigma, out=sigma)
+
+        log_returns = cfg.mu * cfg.dt + sigma * np.sqrt(cfg.dt) * eps
+        prices = 100 * np.exp(np.cumsum(log_returns, axis=0))
+
+        # Introduce missing data
+        mask = self.rng.uniform(size=(n, m)) < cfg.missing_prob
+        log_returns[mask] = np.nan
+
+        return {
+            "log_return": pd.DataFrame(log_returns, index=dates, columns=cols),
+            "price": pd.DataFrame(prices, index=dates, columns=cols),
+            "sigma": pd.DataFrame(sigma, index=dates, columns=cols),
+        }
@@ -3,15 +3,17 @@
 import pandas as pd
 
 from factorlab.data import DataConfig, DataGenerator
-from factorlab.factors import Momentum, Volatility, MeanReversion
+from factorlab.factors import Momentum, Volatility, MeanReversion, FactorEngine
 from factorlab.standardise import zscore_df
 from factorlab.backtest import Backtester
 from factorlab.strategy import TopKStrategy
 from factorlab.utils import plot_nav
 
 class Experiment:
-    def __init__(self, cfg: DataConfig):
+    def __init__(self, cfg: DataConfig, engine: FactorEngine = None):
         self.cfg = cfg
+        # share an engine between experiments to reuse rolling moments on the same panel
+        self.engine = engine if engine is not None else FactorEngine()
     
     def run(self, outpath = None):
         gen = DataGenerator(self.cfg)
@@ -19,14 +21,16 @@ class Experiment:
 
         ret_df = pd.DataFrame({k: v["log_return"] for k, v in assets.items()})
         ret_df = ret_df.ffill().bfill()
+        return self.run_returns(ret_df, outpath = outpath)
 
+    def run_returns(self, ret_df: pd.DataFrame, outpath = None):
         mom = Momentum(window = 20)
         vol = Volatility(window = 20)
         mr = MeanReversion(window = 20)
 
-        mom_df = ret_df.apply(mom.compute)
-        vol_df = ret_df.apply(vol.compute)
-        mr_df = ret_df.apply(mr.compute)
+        mom_df = self.engine.compute(mom, ret_df)
+        vol_df = self.engine.compute(vol, ret_df)
+        mr_df = self.engine.compute(mr, ret_df)
 
         mom_z = zscore_df(mom_df)
         vol_z = zscore_df(vol_df)
@@ -44,6 +48,7 @@ class Experiment:
             plot_nav(results["nav"], outpath)
         
         return {
+            "returns": ret_df,
             "scores": score_df,
             "weights": weights_df,
             "nav": results["nav"],
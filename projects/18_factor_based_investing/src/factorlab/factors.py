@@ -1,5 +1,9 @@
 # --- src/factorlab/factors.py ---
 
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
 class Momentum:
@@ -9,6 +13,9 @@ class Momentum:
     def compute(self, series: pd.Series) -> pd.Series:
         return series.rolling(self.w).mean()
 
+    def from_moments(self, ret_df: pd.DataFrame, mean: pd.DataFrame, std: pd.DataFrame) -> pd.DataFrame:
+        return mean
+
 
 class Volatility:
     def __init__(self, window=20):
@@ -17,6 +24,9 @@ class Volatility:
     def compute(self, series: pd.Series) -> pd.Series:
         return series.rolling(self.w).std(ddof=1)
 
+    def from_moments(self, ret_df: pd.DataFrame, mean: pd.DataFrame, std: pd.DataFrame) -> pd.DataFrame:
+        return std
+
 
 class MeanReversion:
     def __init__(self, window=20):
@@ -26,3 +36,83 @@ class MeanReversion:
         roll_mean = series.rolling(self.w).mean()
         roll_std = series.rolling(self.w).std(ddof=1)
         return -(series - roll_mean) / roll_std
+
+    def from_moments(self, ret_df: pd.DataFrame, mean: pd.DataFrame, std: pd.DataFrame) -> pd.DataFrame:
+        return -(ret_df - mean) / std
+
+
+def rolling_moments(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and std (ddof=1) down the rows of a (dates, assets) array,
+    from one pass of column-centred cumulative sums and sums of squares.
+    A window containing a NaN gives NaN, as with pandas rolling(window).
+    """
+    x = np.asarray(values, dtype=float)
+    n, w = x.shape[0], int(window)
+    mean = np.full(x.shape, np.nan)
+    std = np.full(x.shape, np.nan)
+    if n < w:
+        return mean, std
+
+    nan = np.isnan(x)
+    with np.errstate(invalid="ignore"):
+        centre = np.nanmean(x, axis=0)
+    centre = np.where(np.isnan(centre), 0.0, centre)
+    xc = np.where(nan, 0.0, x - centre)
+
+    def window_sum(a):
+        c = np.cumsum(a, axis=0)
+        out = c[w - 1:].copy()
+        out[1:] -= c[:-w]
+        return out
+
+    s1 = window_sum(xc)
+    s2 = window_sum(xc * xc)
+    n_nan = window_sum(nan.astype(np.int64))
+
+    m = s1 / w
+    var = np.maximum(s2 - w * m * m, 0.0) / (w - 1) if w > 1 else np.full(m.shape, np.nan)
+    bad = n_nan > 0
+    m[bad] = np.nan
+    var[bad] = np.nan
+
+    mean[w - 1:] = m + centre
+    std[w - 1:] = np.sqrt(var)
+    return mean, std
+
+
+class FactorEngine:
+    """
+    Computes rolling moments once per (returns panel, window) and derives
+    window-based factors from them via their from_moments method.
+
+    Cache entries keep a reference to the panel they were built from and
+    are reused only for that same object (so a regenerated or reassigned
+    panel never gets stale moments); panels must not be mutated in place
+    while cached. At most max_entries (panel, window) pairs are kept, LRU.
+    """
+    def __init__(self, max_entries = 8):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+
+    def moments(self, ret_df: pd.DataFrame, window: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        key = (id(ret_df), int(window))
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] is ret_df:
+            self._cache.move_to_end(key)
+            return hit[1], hit[2]
+
+        mean, std = rolling_moments(ret_df.to_numpy(dtype=float), window)
+        mean = pd.DataFrame(mean, index=ret_df.index, columns=ret_df.columns)
+        std = pd.DataFrame(std, index=ret_df.index, columns=ret_df.columns)
+        self._cache[key] = (ret_df, mean, std)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return mean, std
+
+    def compute(self, factor, ret_df: pd.DataFrame) -> pd.DataFrame:
+        mean, std = self.moments(ret_df, factor.w)
+        return factor.from_moments(ret_df, mean, std)
+
+    def clear(self):
+        self._cache.clear()
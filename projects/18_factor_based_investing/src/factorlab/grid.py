@@ -0,0 +1,116 @@
+# --- src/factorlab/grid.py ---
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple
+from typing import Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+from factorlab.data import DataConfig, DataGenerator
+from factorlab.factors import Momentum, Volatility, MeanReversion, FactorEngine
+from factorlab.standardise import zscore_df
+from factorlab.backtest import Backtester
+from factorlab.strategy import TopKStrategy
+
+def _run_leaves(ret_df: pd.DataFrame, score_df: pd.DataFrame, ks: List[Tuple[int, int]]) -> List[dict]:
+    """Weights + backtest for every (k_long, k_short) on one score panel."""
+    out = []
+    bt = Backtester()
+    for k_long, k_short in ks:
+        weights_df = TopKStrategy(k_long = k_long, k_short = k_short).allocate(score_df)
+        out.append(bt.run(ret_df, weights_df)["stats"])
+    return out
+
+class ExperimentGrid:
+    """
+    Runs Experiment-style pipelines over a parameter grid as a dependency graph:
+
+        data(cfg) -> factors/z-scores(window) -> scores(blend) -> weights + backtest(k_long, k_short)
+
+    Every node is memoised on its own parameters plus its parents', so a
+    node shared by many grid points is computed once, and calling run again
+    with a changed or extended grid only computes the new nodes. Inner nodes
+    run in this process (factors share rolling moments through one
+    FactorEngine); leaves are sent to a process pool, one task per score
+    panel. A blend is (w_mom, w_vol, w_mr): score = w_mom*mom_z + w_vol*vol_z + w_mr*mr_z,
+    so Experiment's default is (1.0, -0.5, 1.0).
+    """
+    def __init__(self, n_workers = None):
+        self.n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+        self.engine = FactorEngine()
+        self._data: Dict[tuple, pd.DataFrame] = {}
+        self._zscores: Dict[tuple, tuple] = {}
+        self._scores: Dict[tuple, pd.DataFrame] = {}
+        self._leaves: Dict[tuple, dict] = {}
+        self.n_computed = {"data": 0, "zscores": 0, "scores": 0, "leaves": 0}
+
+    def _data_node(self, cfg: DataConfig) -> pd.DataFrame:
+        key = astuple(cfg)
+        if key not in self._data:
+            assets = DataGenerator(cfg).generate()
+            ret_df = pd.DataFrame({k: v["log_return"] for k, v in assets.items()})
+            self._data[key] = ret_df.ffill().bfill()
+            self.n_computed["data"] += 1
+        return self._data[key]
+
+    def _zscore_node(self, cfg: DataConfig, window: int) -> tuple:
+        key = (astuple(cfg), window)
+        if key not in self._zscores:
+            ret_df = self._data_node(cfg)
+            factors = [Momentum(window = window), Volatility(window = window), MeanReversion(window = window)]
+            self._zscores[key] = tuple(zscore_df(self.engine.compute(f, ret_df)) for f in factors)
+            self.n_computed["zscores"] += 1
+        return self._zscores[key]
+
+    def _score_node(self, cfg: DataConfig, window: int, blend: tuple) -> pd.DataFrame:
+        key = (astuple(cfg), window, blend)
+        if key not in self._scores:
+            mom_z, vol_z, mr_z = self._zscore_node(cfg, window)
+            w_mom, w_vol, w_mr = blend
+            self._scores[key] = w_mom * mom_z + w_vol * vol_z + w_mr * mr_z
+            self.n_computed["scores"] += 1
+        return self._scores[key]
+
+    def run(self, cfgs: Iterable[DataConfig], windows: Iterable[int] = (20,),
+            blends: Iterable[tuple] = ((1.0, -0.5, 1.0),),
+            ks: Iterable[Tuple[int, int]] = ((2, 2),)) -> pd.DataFrame:
+        """
+        Evaluate the full cross-product and return one row of stats per grid point.
+        """
+        cfgs, windows = list(cfgs), [int(w) for w in windows]
+        blends = [tuple(float(x) for x in b) for b in blends]
+        ks = [(int(a), int(b)) for a, b in ks]
+
+        # group missing leaves by score panel so each panel is shipped once
+        tasks = []
+        for cfg in cfgs:
+            for w in windows:
+                for blend in blends:
+                    score_key = (astuple(cfg), w, blend)
+                    todo = [k for k in ks if score_key + k not in self._leaves]
+                    if todo:
+                        tasks.append((score_key, self._data_node(cfg), self._score_node(cfg, w, blend), todo))
+
+        if tasks:
+            args = [t[1:] for t in tasks]
+            if self.n_workers == 1:
+                results = [_run_leaves(*a) for a in args]
+            else:
+                with ProcessPoolExecutor(max_workers = self.n_workers) as pool:
+                    results = list(pool.map(_run_leaves, *zip(*args)))
+            for (score_key, _, _, todo), stats in zip(tasks, results):
+                for k, st in zip(todo, stats):
+                    self._leaves[score_key + k] = st
+                    self.n_computed["leaves"] += 1
+
+        rows = []
+        for i, cfg in enumerate(cfgs):
+            for w in windows:
+                for blend in blends:
+                    for k in ks:
+                        st = self._leaves[(astuple(cfg), w, blend) + k]
+                        rows.append({"cfg": i, "seed": cfg.seed, "window": w,
+                                     "w_mom": blend[0], "w_vol": blend[1], "w_mr": blend[2],
+                                     "k_long": k[0], "k_short": k[1], **st})
+        return pd.DataFrame(rows)
@@ -0,0 +1,43 @@
+# --- src/factorlab/sparse.py ---
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+@dataclass
+class SparseWeights:
+    """
+    CSR-style (dates x assets) weight matrix: the non-zero weights of date i
+    are values[indptr[i]:indptr[i+1]] on asset columns indices[...], sorted
+    by column within each date. Memory is O(nnz) ~ (k_long + k_short) * T.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    values: np.ndarray
+    index: pd.Index
+    columns: pd.Index
+
+    @property
+    def shape(self):
+        return (len(self.index), len(self.columns))
+
+    @property
+    def nnz(self) -> int:
+        return len(self.values)
+
+    def row_ids(self) -> np.ndarray:
+        """Date position of every stored entry."""
+        return np.repeat(np.arange(len(self.index)), np.diff(self.indptr))
+
+    @classmethod
+    def from_dense(cls, weights: np.ndarray, index, columns) -> "SparseWeights":
+        rows, cols = np.nonzero(weights)
+        indptr = np.zeros(weights.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=weights.shape[0]), out=indptr[1:])
+        return cls(indptr, cols.astype(np.int64), weights[rows, cols], pd.Index(index), pd.Index(columns))
+
+    def to_dense(self) -> pd.DataFrame:
+        out = np.zeros(self.shape)
+        out[self.row_ids(), self.indices] = self.values
+        return pd.DataFrame(out, index=self.index, columns=self.columns)
@@ -1,5 +1,6 @@
 # --- src/factorlab/standardise.py ---
 
+import numpy as np
 import pandas as pd
 
 def zscore_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -7,3 +8,40 @@ def zscore_df(df: pd.DataFrame) -> pd.DataFrame:
     Cross-sectional z-score (per row across assets).
     """
     return (df - df.mean(axis=1).values.reshape(-1,1)) / df.std(axis=1, ddof=1).values.reshape(-1,1)
+
+def zscore_chunked(values, out: np.ndarray = None, block_rows: int = 512,
+                   winsorise: float = None, rank: bool = False) -> np.ndarray:
+    """
+    Cross-sectional z-score processed block_rows dates at a time.
+
+    NaNs are skipped explicitly (mean/std over the valid assets of each row,
+    ddof=1; rows with fewer than two valid values come out all-NaN) and stay
+    NaN in the output. rank=True standardises the row ranks (average ties)
+    instead of the raw values; winsorise=k clips the result to [-k, k].
+
+    out may be any float array of the same shape, e.g. float32 to halve the
+    result, or `values` itself to standardise in place. Temporaries are only
+    one block in size, so peak memory is bounded by block_rows x n_assets
+    rather than the full panel. Returns out.
+    """
+    x_all = values.to_numpy() if isinstance(values, pd.DataFrame) else values
+    if out is None:
+        out = np.empty(x_all.shape, dtype=float)
+    if out.shape != x_all.shape:
+        raise ValueError("out must have the same shape as values.")
+
+    for start in range(0, x_all.shape[0], block_rows):
+        x = np.array(x_all[start:start + block_rows], dtype=float)
+        if rank:
+            x = pd.DataFrame(x).rank(axis=1).to_numpy(copy=True)
+        valid = ~np.isnan(x)
+        n = valid.sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x -= np.where(valid, x, 0.0).sum(axis=1, keepdims=True) / n
+            dev = np.where(valid, x, 0.0)
+            x /= np.sqrt((dev * dev).sum(axis=1, keepdims=True) / (n - 1))
+        x[n[:, 0] < 2] = np.nan
+        if winsorise is not None:
+            np.clip(x, -winsorise, winsorise, out=x)
+        out[start:start + block_rows] = x
+    return out
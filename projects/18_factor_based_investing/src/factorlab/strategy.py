@@ -3,30 +3,87 @@
 import numpy as np
 import pandas as pd
 
+from factorlab.sparse import SparseWeights
+
+def _select_k(key: np.ndarray, k: int, valid: np.ndarray, prefer_last: bool = False) -> np.ndarray:
+    """
+    Boolean mask of the k smallest valid entries per row, via partial selection.
+    Ties at the k-th value are filled in column order (from the right if prefer_last).
+    """
+    n_rows, n = key.shape
+    mask = np.zeros(key.shape, dtype=bool)
+    if k <= 0 or n == 0:
+        return mask
+    kk = min(k, n)
+    kth = np.partition(key, kk - 1, axis=1)[:, kk - 1:kk]
+
+    strict = valid & (key < kth)
+    need = np.minimum(kk, valid.sum(axis=1)) - strict.sum(axis=1)
+    ties = valid & (key == kth)
+    order = np.cumsum(ties[:, ::-1], axis=1)[:, ::-1] if prefer_last else np.cumsum(ties, axis=1)
+    return strict | (ties & (order <= need[:, None]))
+
 class TopKStrategy:
     def __init__(self, k_long = 2, k_short = 2):
         self.k_long = k_long
         self.k_short = k_short
-    
-    def allocate(self, score_df: pd.DataFrame) -> pd.DataFrame:
+
+    def allocate_array(self, scores: np.ndarray) -> np.ndarray:
         """
-        Returns a DataFrame of weights.
+        Array version of allocate on a (dates, assets) score matrix.
+
+        Long set: the k_long highest scores; short set: the k_short lowest
+        (short wins where they overlap). NaN scores are never selected, and
+        ties are broken as rank(method="first") would: earlier columns rank
+        higher. Rows are normalised to unit absolute exposure.
         """
-        n = score_df.shape[1]
-        weights = pd.DataFrame(0.0, index = score_df.index, columns = score_df.columns)
+        s = np.asarray(scores, dtype=float)
+        valid = ~np.isnan(s)
+        filled = np.where(valid, s, np.inf)
 
-        ranks = score_df.rank(axis = 1, method = "first", ascending = False)
+        long_mask = _select_k(np.where(valid, -s, np.inf), self.k_long, valid)
+        short_mask = _select_k(filled, self.k_short, valid, prefer_last=True)
 
-        for t in score_df.index:
-            long_assets = ranks.loc[t].nsmallest(self.k_long).index
-            short_assets = ranks.loc[t].nlargest(self.k_short).index
+        weights = np.zeros(s.shape)
+        weights[long_mask] = 1.0 / self.k_long
+        weights[short_mask] = 1.0 / self.k_short
 
-            weights.loc[t, long_assets] = 1.0 / self.k_long
-            weights.loc[t, short_assets] = 1.0 / self.k_short
-        
         # --- Total abs exposure normalisation to 1 ---
-        abs_sum = weights.abs().sum(axis = 1).replace(0, 1)
-        weights= weights.div(abs_sum, axis = 0)
-        
+        abs_sum = np.abs(weights).sum(axis = 1)
+        abs_sum[abs_sum == 0] = 1.0
+        weights /= abs_sum[:, None]
         return weights
-    
\ No newline at end of file
+
+    def allocate(self, score_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns a DataFrame of weights.
+        """
+        weights = self.allocate_array(score_df.to_numpy(dtype=float))
+        return pd.DataFrame(weights, index = score_df.index, columns = score_df.columns)
+
+    def allocate_sparse(self, score_df: pd.DataFrame, block_rows = 256) -> SparseWeights:
+        """
+        Same weights as allocate, returned as SparseWeights. Dates are
+        processed block_rows at a time, so no dense (dates x assets) weight
+        matrix is ever built.
+        """
+        scores = score_df.to_numpy(dtype=float)
+        n_rows = scores.shape[0]
+        counts = np.zeros(n_rows, dtype=np.int64)
+        indices, values = [], []
+        for start in range(0, n_rows, block_rows):
+            w = self.allocate_array(scores[start:start + block_rows])
+            rows, cols = np.nonzero(w)
+            counts[start:start + len(w)] = np.bincount(rows, minlength=len(w))
+            indices.append(cols)
+            values.append(w[rows, cols])
+
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return SparseWeights(
+            indptr,
+            np.concatenate(indices).astype(np.int64) if indices else np.empty(0, dtype=np.int64),
+            np.concatenate(values) if values else np.empty(0),
+            score_df.index,
+            score_df.columns,
+        )
@@ -0,0 +1,30 @@
+# --- tests/test_analytics.py ---
+
+import numpy as np
+import pandas as pd
+from factorlab.analytics import factor_turnover, forward_returns, ic_summary, rank_ic
+
+def test_rank_ic_matches_pandas_spearman():
+    rng = np.random.default_rng(2)
+    ret = pd.DataFrame(rng.normal(scale = 0.01, size = (60, 12)))
+    scores = pd.DataFrame(rng.normal(size = (60, 12)))
+    scores.iloc[3, [1, 4]] = np.nan
+    ret.iloc[10, 0] = np.nan
+
+    ic = rank_ic(scores, ret, horizons = [1, 5])
+    for h in [1, 5]:
+        fwd = ret.rolling(h).sum().shift(-h)
+        for t in [0, 3, 7, 20, 50]:
+            expected = scores.iloc[t].corr(fwd.iloc[t], method = "spearman")
+            assert abs(ic.loc[t, h] - expected) < 1e-12
+    assert ic[5].iloc[-5:].isna().all()
+
+    summary = ic_summary(ic)
+    assert list(summary.index) == [1, 5]
+    np.testing.assert_allclose(forward_returns(ret, 2).iloc[0], ret.iloc[1:3].sum(), atol = 1e-15)
+
+def test_factor_turnover():
+    scores = pd.DataFrame([[1, 2, 3, 4], [1, 2, 3, 4], [4, 3, 2, 1]], dtype = float)
+    to = factor_turnover(scores)
+    assert np.isnan(to.iloc[0])
+    assert abs(to.iloc[1]) < 1e-12 and abs(to.iloc[2] - 2.0) < 1e-12
@@ -0,0 +1,33 @@
+# --- tests/test_backtest.py ---
+
+import numpy as np
+import pandas as pd
+from factorlab.backtest import Backtester
+from factorlab.strategy import TopKStrategy
+
+def test_sparse_path_matches_dense():
+    rng = np.random.default_rng(4)
+    idx = pd.date_range("2020-01-01", periods = 120, freq = "B")
+    cols = [f"asset_{i}" for i in range(30)]
+    scores = pd.DataFrame(rng.normal(size = (120, 30)), index = idx, columns = cols)
+    scores.iloc[:5] = np.nan
+    returns = pd.DataFrame(rng.normal(scale = 0.01, size = (120, 30)), index = idx, columns = cols)
+
+    strat = TopKStrategy(k_long = 3, k_short = 2)
+    dense = strat.allocate(scores)
+    sparse = strat.allocate_sparse(scores, block_rows = 16)
+    assert sparse.nnz == 5 * 115
+    pd.testing.assert_frame_equal(sparse.to_dense(), dense)
+
+    bt = Backtester()
+    d, s = bt.run(returns, dense), bt.run_sparse(returns, sparse)
+    np.testing.assert_allclose(s["returns"], d["returns"], atol = 1e-15)
+    np.testing.assert_allclose(s["turnover"], d["turnover"], atol = 1e-12)
+    for k, v in d["stats"].items():
+        assert abs(s["stats"][k] - v) < 1e-12
+
+    # returns with the columns in another order are matched up by label
+    shuffled = returns[cols[::-1]]
+    d, s = bt.run(shuffled, dense), bt.run_sparse(shuffled, sparse)
+    np.testing.assert_allclose(s["returns"], d["returns"], atol = 1e-15)
+    assert abs(s["stats"]["sharpe"] - d["stats"]["sharpe"]) < 1e-12
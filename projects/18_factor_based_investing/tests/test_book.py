@@ -0,0 +1,48 @@
+# --- tests/test_book.py ---
+
+import numpy as np
+import pandas as pd
+from factorlab.book import FactorBook
+from factorlab.data import DataConfig, DataGenerator
+from factorlab.experiment import Experiment
+
+def test_factor_book_matches_experiment_and_restores(tmp_path):
+    cfg = DataConfig(n_assets = 8, n_steps = 150, missing_prob = 0.0, seed = 5)
+    assets = DataGenerator(cfg).generate()
+    ret_df = pd.DataFrame({k: v["log_return"] for k, v in assets.items()})
+    res = Experiment(cfg).run_returns(ret_df)
+
+    book = FactorBook(ret_df.columns, window = 20)
+    scores, weights = [], []
+    for i, (date, row) in enumerate(ret_df.iterrows()):
+        if i == 100:
+            book.save(tmp_path / "book.npz")
+            book = FactorBook.load(tmp_path / "book.npz")
+        s, w = book.append(date, row)
+        scores.append(s)
+        weights.append(w)
+    scores, weights = pd.DataFrame(scores), pd.DataFrame(weights)
+
+    pd.testing.assert_frame_equal(scores, res["scores"], rtol = 1e-8, check_freq = False, check_names = False)
+    pd.testing.assert_frame_equal(weights, res["weights"], check_freq = False, check_names = False)
+    assert book.last_date == ret_df.index[-1]
+
+def test_factor_book_late_listing_and_suffixless_checkpoint(tmp_path):
+    cfg = DataConfig(n_assets = 5, n_steps = 80, missing_prob = 0.0, seed = 7)
+    assets = DataGenerator(cfg).generate()
+    ret_df = pd.DataFrame({k: v["log_return"] for k, v in assets.items()})
+    ret_df.iloc[:25, 0] = np.nan          # asset_1 lists on row 25
+    res = Experiment(cfg).run_returns(ret_df)
+
+    book = FactorBook(ret_df.columns, window = 20)
+    scores = []
+    for i, (date, row) in enumerate(ret_df.iterrows()):
+        if i == 30:
+            book.save(tmp_path / "book")
+            book = FactorBook.load(tmp_path / "book")
+        scores.append(book.append(date, row)[0])
+    scores = pd.DataFrame(scores)
+
+    # first full window of real data for asset_1 ends on row 44
+    assert scores.iloc[:44, 0].isna().all() and scores.iloc[44:, 0].notna().all()
+    pd.testing.assert_frame_equal(scores, res["scores"], rtol = 1e-8, check_freq = False, check_names = False)
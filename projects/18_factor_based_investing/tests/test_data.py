@@ -0,0 +1,20 @@
+# --- tests/test_data.py ---
+
+import numpy as np
+from factorlab.data import DataConfig, DataGenerator
+
+def test_generate_panel_shapes_and_missing():
+    cfg = DataConfig(n_assets = 40, n_steps = 300, missing_prob = 0.1, seed = 3)
+    panel = DataGenerator(cfg).generate_panel()
+    ret = panel["log_return"]
+    assert ret.shape == (300, 40)
+    assert list(ret.columns[:2]) == ["asset_1", "asset_2"]
+    assert 0.05 < ret.isna().mean().mean() < 0.15
+    assert not panel["price"].isna().any().any()
+    assert (panel["sigma"] >= 0).all().all()
+
+    # with tiny shocks the recursion stays positive, so it can be checked exactly
+    cfg_small = DataConfig(n_assets = 3, n_steps = 50, xi = 1e-6, seed = 1)
+    s = DataGenerator(cfg_small).generate_panel()["sigma"].values
+    expected = s[0] * cfg_small.beta + cfg_small.alpha
+    assert np.allclose(s[1], expected, atol = 1e-5)
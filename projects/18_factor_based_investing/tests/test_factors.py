@@ -2,7 +2,7 @@
 
 import pandas as pd
 import numpy as np
-from factorlab.factors import Momentum
+from factorlab.factors import Momentum, Volatility, MeanReversion, FactorEngine
 
 def test_momentum_correct():
     rng = np.random.default_rng(0)
@@ -12,3 +12,18 @@ def test_momentum_correct():
     expected = df.rolling(5).mean()
     assert abs(mom.iloc[20] - expected.iloc[20]) < 1e-12
 
+
+def test_factor_engine_matches_column_apply():
+    rng = np.random.default_rng(1)
+    vals = rng.normal(scale = 0.01, size = (200, 6)) + 0.001
+    vals[rng.uniform(size = vals.shape) < 0.03] = np.nan
+    ret_df = pd.DataFrame(vals)
+    engine = FactorEngine()
+    for factor in [Momentum(window = 10), Volatility(window = 10), MeanReversion(window = 10)]:
+        expected = ret_df.apply(factor.compute)
+        got = engine.compute(factor, ret_df)
+        pd.testing.assert_frame_equal(got, expected, rtol = 1e-8, atol = 1e-12)
+    # one moments computation shared by all three factors
+    assert len(engine._cache) == 1
+    assert engine.moments(ret_df, 10)[0] is engine.moments(ret_df, 10)[0]
+    assert engine.moments(ret_df.copy(), 10)[0] is not engine.moments(ret_df, 10)[0]
@@ -0,0 +1,24 @@
+# --- tests/test_grid.py ---
+
+from factorlab.data import DataConfig
+from factorlab.experiment import Experiment
+from factorlab.grid import ExperimentGrid
+
+def test_grid_matches_experiment_and_memoises():
+    cfgs = [DataConfig(n_assets = 6, n_steps = 200, seed = s) for s in (1, 2)]
+    grid = ExperimentGrid(n_workers = 1)
+    res = grid.run(cfgs, windows = [20], ks = [(2, 2), (1, 1)])
+    assert len(res) == 4
+    assert grid.n_computed == {"data": 2, "zscores": 2, "scores": 2, "leaves": 4}
+
+    expected = Experiment(cfgs[0]).run()["stats"]
+    row = res[(res["seed"] == 1) & (res["k_long"] == 2)].iloc[0]
+    for k, v in expected.items():
+        assert abs(row[k] - v) < 1e-12
+
+    # only the new blend's scores and leaves are computed
+    grid.run(cfgs, windows = [20], blends = [(1.0, -0.5, 1.0), (1.0, 0.0, 0.0)], ks = [(2, 2), (1, 1)])
+    assert grid.n_computed == {"data": 2, "zscores": 2, "scores": 4, "leaves": 8}
+
+    parallel = ExperimentGrid(n_workers = 2).run(cfgs, windows = [20], ks = [(2, 2), (1, 1)])
+    assert (parallel["sharpe"].values == res["sharpe"].values).all()
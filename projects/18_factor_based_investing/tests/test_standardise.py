@@ -0,0 +1,32 @@
+# --- tests/test_standardise.py ---
+
+import numpy as np
+import pandas as pd
+from factorlab.standardise import zscore_chunked, zscore_df
+
+def test_zscore_chunked_matches_zscore_df():
+    rng = np.random.default_rng(3)
+    vals = rng.normal(size = (100, 9))
+    vals[rng.uniform(size = vals.shape) < 0.1] = np.nan
+    vals[7, 1:] = np.nan
+    df = pd.DataFrame(vals)
+
+    expected = zscore_df(df).to_numpy()
+    np.testing.assert_allclose(zscore_chunked(df, block_rows = 16), expected, rtol = 1e-12)
+
+    out32 = np.empty(vals.shape, dtype = np.float32)
+    zscore_chunked(vals, out = out32, block_rows = 7)
+    np.testing.assert_allclose(out32, expected, rtol = 1e-6)
+
+    inplace = vals.copy()
+    zscore_chunked(inplace, out = inplace, block_rows = 33)
+    np.testing.assert_allclose(inplace, expected, rtol = 1e-12)
+
+def test_zscore_chunked_rank_and_winsorise():
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame(rng.standard_t(2, size = (50, 30)))
+    ranked = zscore_chunked(df, rank = True, block_rows = 8)
+    np.testing.assert_allclose(ranked, zscore_df(df.rank(axis = 1)).to_numpy(), rtol = 1e-12)
+
+    clipped = zscore_chunked(df, winsorise = 1.5)
+    assert np.nanmax(np.abs(clipped)) <= 1.5
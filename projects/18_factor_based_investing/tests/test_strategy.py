@@ -1,5 +1,6 @@
 # --- tests/test_strategy.py ---
 
+import numpy as np
 import pandas as pd
 from factorlab.strategy import TopKStrategy
 
@@ -15,3 +16,33 @@ def test_weights_normalised():
     w = strat.allocate(df)
     assert all(abs(w.abs().sum(axis = 1) - 1) < 1e-12)
 
+
+
+def _allocate_loop(strat, score_df):
+    # reference: the original per-date implementation
+    weights = pd.DataFrame(0.0, index = score_df.index, columns = score_df.columns)
+    ranks = score_df.rank(axis = 1, method = "first", ascending = False)
+    for t in score_df.index:
+        long_assets = ranks.loc[t].nsmallest(strat.k_long).index
+        short_assets = ranks.loc[t].nlargest(strat.k_short).index
+        weights.loc[t, long_assets] = 1.0 / strat.k_long
+        weights.loc[t, short_assets] = 1.0 / strat.k_short
+    abs_sum = weights.abs().sum(axis = 1).replace(0, 1)
+    return weights.div(abs_sum, axis = 0)
+
+
+def test_vectorised_matches_loop_with_nans_and_ties():
+    rng = np.random.default_rng(0)
+    vals = rng.integers(0, 4, size = (60, 7)).astype(float)
+    vals[rng.uniform(size = vals.shape) < 0.2] = np.nan
+    vals[5] = np.nan
+    df = pd.DataFrame(vals, columns = list("ABCDEFG"))
+    n_valid = df.notna().sum(axis = 1)
+    for k_long, k_short in [(1, 1), (2, 3), (4, 4), (9, 2)]:
+        strat = TopKStrategy(k_long = k_long, k_short = k_short)
+        w = strat.allocate(df)
+        # the loop padded short rows with NaN-score assets; the array path never picks them
+        full = n_valid >= max(k_long, k_short)
+        pd.testing.assert_frame_equal(w[full], _allocate_loop(strat, df)[full])
+        assert (w[df.isna()].fillna(0) == 0).all().all()
+        assert (w.iloc[5] == 0).all()
@@ -1,3 +1,3 @@
 # --- src/vollab/__init__.py
 
-__all__ = ["data", "cleaning", "garch_base", "garch", "egarch", "gjr", "forecast", "evaluation", "experiment"]
+__all__ = ["data", "cleaning", "garch_base", "garch", "egarch", "gjr", "batch", "streaming", "forecast", "evaluation", "experiment"]
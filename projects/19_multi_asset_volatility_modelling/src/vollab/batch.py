@@ -0,0 +1,242 @@
+# --- src/vollab/batch.py ---
+
+import numpy as np
+import pandas as pd
+from typing import Dict
+from .garch_base import batch_variance_filter
+
+LOG_2PI = np.log(2 * np.pi)
+# relative nll gain per iteration below which an asset switches to Newton steps
+NEWTON_GAIN = 1e-5
+# tighter than fit()'s defaults, which stop L-BFGS-B short of the optimum
+# on the flat likelihoods that are left over for the polish
+POLISH_OPTIONS = {"maxiter": 2000, "ftol": 1e-15, "gtol": 1e-12}
+
+class _Objective:
+    """
+    Gaussian nll of sigma2_t = params[:-1] . X_t + beta * sigma2_{t-1} for a
+    block of assets, evaluated in buffers allocated once per block: at
+    (n_obs, n_assets) sizes, fresh multi-MB temporaries per numpy op cost
+    more than the arithmetic itself.
+    """
+    def __init__(self, X, r2, first):
+        self.X, self.r2, self.first = X, r2, first      # (k-1, n, m), (n, m), (m,)
+        kx, n, m = X.shape
+        self.s = np.empty((n, m))
+        self.tmp = np.empty((n, m))
+        self.log_s = np.empty((n, m))
+        self.D = np.empty((n, kx + 1, m))
+        self.C = np.empty((n, kx + 1, m))
+        self.W = np.empty((n, kx + 1, m))
+
+    def take(self, cols):
+        return _Objective(self.X[:, :, cols], self.r2[:, cols], self.first[cols])
+
+    def _sigma2(self, params):
+        s, tmp = self.s, self.tmp
+        np.multiply(self.X[0], params[0], out=s)
+        for j in range(1, len(self.X)):
+            np.multiply(self.X[j], params[j], out=tmp)
+            s += tmp
+        batch_variance_filter(s, params[-1], self.first, out=s)
+        return np.maximum(s, 1e-12, out=s)
+
+    def _nll(self, s):
+        np.divide(self.r2, s, out=self.tmp)
+        np.log(s, out=self.log_s)
+        return 0.5 * (len(s) * LOG_2PI + self.log_s.sum(axis=0) + self.tmp.sum(axis=0))
+
+    def nll(self, params):
+        return self._nll(self._sigma2(params))
+
+    def nll_grad(self, params):
+        """
+        nll and gradient (k, m). Leaves the filtered d sigma2 / d params and
+        the first and second derivatives of nll_t in sigma2_t in place for
+        hessian() / bhhh().
+        """
+        s = self._sigma2(params)
+        nll = self._nll(s)
+        # d sigma2_t: regressors, plus sigma2_{t-1} for beta, filtered by beta
+        D = self.D
+        D[:, :-1] = self.X.transpose(1, 0, 2)
+        D[0, -1] = 0.0
+        D[1:, -1] = s[:-1]
+        batch_variance_filter(D, params[-1], 0.0, out=D)
+        self.beta = params[-1]
+        # d nll_t / d sigma2_t = 0.5 * (1 - r2 / sigma2) / sigma2, and the second
+        # derivative is (r2 / sigma2 - 0.5) / sigma2^2; tmp holds r2 / sigma2
+        h = np.subtract(self.tmp, 0.5, out=self.log_s)
+        h /= s
+        h /= s
+        g = np.subtract(1.0, self.tmp, out=self.tmp)
+        g /= s
+        g *= 0.5
+        return nll, np.einsum("tkm,tm->km", D, g)
+
+    def _columns(self, cols):
+        # most of the block is cheaper through the preallocated buffers (then
+        # indexed) than by copying the columns out
+        if 2 * len(cols) > self.D.shape[2]:
+            return slice(None), self.C, self.W
+        return cols, None, None
+
+    def hessian(self, cols):
+        """Exact Hessian (len(cols), k, k) at the last nll_grad point."""
+        sel, C, W = self._columns(cols)
+        D, g, h = self.D[:, :, sel], self.tmp[:, sel], self.log_s[:, sel]
+        # only the beta input sigma2_{t-1} depends on params, so the second
+        # derivative is e_beta c_t' + c_t e_beta' with c = filtered d sigma2_{t-1}
+        if C is None:
+            C = np.empty_like(D)
+        C[0] = 0.0
+        C[1:] = D[:-1]
+        batch_variance_filter(C, self.beta[sel], 0.0, out=C)
+        W = np.multiply(D, h[:, None, :], out=W)
+        H = np.einsum("tkm,tlm->mkl", W, D)
+        gc = np.einsum("tkm,tm->mk", C, g)
+        H[:, -1, :] += gc
+        H[:, :, -1] += gc
+        return H if isinstance(sel, np.ndarray) else H[cols]
+
+    def bhhh(self, cols):
+        """BHHH (outer product of scores) Hessian at the last nll_grad point."""
+        sel, _, W = self._columns(cols)
+        scores = np.multiply(self.D[:, :, sel], self.tmp[:, None, sel], out=W)
+        H = np.einsum("tkm,tlm->mkl", scores, scores)
+        return H if isinstance(sel, np.ndarray) else H[cols]
+
+def fit_batch(returns, model_class, x0=None, maxiter=100, tol=1e-10, max_backtracks=20) -> Dict[str, object]:
+    """
+    Fit one model_class per column of an (n_obs, n_assets) return matrix.
+
+    The likelihood is block-separable, so each asset takes its own projected
+    step inside the bounds (BHHH, i.e. the outer product of per-observation
+    scores, while far from its optimum; Newton on the exact Hessian once its
+    per-iteration gain is small), backtracking per asset, while every
+    evaluation runs the variance recursion for all still-active assets in
+    one pass over time. An asset has status "converged" when its predicted
+    or achieved nll decrease falls below tol relative to its nll. Assets
+    whose line search fails, or that are still running after maxiter
+    iterations, are finished by the single-asset fit() warm-started from the
+    batch params: "polished" if that succeeds, "not_converged" otherwise.
+    model_class must implement _batch_design.
+    x0 is an optional (n_assets, k) warm start.
+
+    Returns a dict with "params" (assets x param names), "loglik" (per
+    asset), "sigma2" (fitted variances, same shape as returns), "status",
+    "converged" (status == "converged") and "nit" (batch iterations).
+    """
+    if isinstance(returns, pd.DataFrame):
+        index, columns = returns.index, returns.columns
+        r = returns.to_numpy(dtype=float)
+    else:
+        r = np.asarray(returns, dtype=float)
+        index, columns = pd.RangeIndex(r.shape[0]), pd.RangeIndex(r.shape[1])
+    if r.ndim != 2:
+        raise ValueError("returns must be a 2-d (n_obs, n_assets) matrix")
+    if np.isnan(r).any():
+        raise ValueError("returns contain NaN; clean and align the panel first")
+
+    model = model_class()
+    if not model._has_batch_recursion():
+        raise ValueError(f"{model_class.__name__} has no batched variance recursion")
+    n_assets = r.shape[1]
+    bounds = model._bounds()
+    k = len(bounds)
+    lo = np.array([b[0] for b in bounds])[:, None]
+    hi = np.array([b[1] for b in bounds])[:, None]
+    if x0 is None:
+        params = model._batch_initial_params(r)
+    else:
+        params = np.asarray(x0, dtype=float).T.copy()
+    params = np.clip(params, lo, hi)
+
+    full = _Objective(np.ascontiguousarray(model._batch_design(r).transpose(1, 0, 2)), r ** 2, r.var(axis=0))
+    obj = full
+    status = np.full(n_assets, "", dtype=object)
+    polish = []
+    step_len = np.ones(n_assets)
+    last_gain = np.full(n_assets, np.inf)
+    active = np.arange(n_assets)
+    nit = 0
+    while active.size and nit < maxiter:
+        nit += 1
+        p = params[:, active]
+        nll, grad = obj.nll_grad(p)
+        # BHHH until an asset is near its optimum (full Newton steps from far
+        # away can land in the alpha ~ 0, beta ~ 1 corner), then Newton where
+        # the exact Hessian is positive definite
+        H = np.empty((active.size, k, k))
+        use_bhhh = np.ones(active.size, dtype=bool)
+        near = np.flatnonzero(last_gain[active] < NEWTON_GAIN)
+        if near.size:
+            Hn = obj.hessian(near)
+            d = np.sqrt(np.abs(np.diagonal(Hn, axis1=1, axis2=2))) + 1e-300
+            definite = np.linalg.eigvalsh(Hn / (d[:, :, None] * d[:, None, :]))[:, 0] > 1e-8
+            H[near] = Hn
+            use_bhhh[near[definite]] = False
+        if use_bhhh.any():
+            H[use_bhhh] = obj.bhhh(np.flatnonzero(use_bhhh))
+        # params pinned at a bound by the gradient are held fixed this step
+        pinned = ((p <= lo) & (grad > 0)) | ((p >= hi) & (grad < 0))
+        grad[pinned] = 0.0
+        free = (~pinned).T.astype(float)
+        H = H * free[:, :, None] * free[:, None, :] + np.eye(k) * (1.0 - free)[:, :, None]
+        # rescale so omega (~1e-6) and the O(1) coefficients are comparable
+        d = np.sqrt(np.maximum(np.diagonal(H, axis1=1, axis2=2), 1e-300))
+        Hs = H / (d[:, :, None] * d[:, None, :]) + 1e-10 * np.eye(k)
+        step = (-np.linalg.solve(Hs, (grad.T / d)[..., None])[..., 0] / d).T
+        thresh = tol * np.maximum(np.abs(nll), 1.0)
+        small = -0.5 * (grad * step).sum(axis=0) <= thresh
+
+        # full-width trial from 4x the last accepted length, then per-asset
+        # backtracking on the (few) assets it did not improve
+        a = np.minimum(1.0, 4.0 * step_len[active])
+        trial = np.clip(p + a * step, lo, hi)
+        new_nll = obj.nll(trial)
+        accepted = new_nll < nll
+        pending = np.flatnonzero(~accepted & ~small)
+        for _ in range(max_backtracks):
+            if not pending.size:
+                break
+            a[pending] *= 0.25
+            t = np.clip(p[:, pending] + a[pending] * step[:, pending], lo, hi)
+            t_nll = obj.take(pending).nll(t)
+            ok = t_nll < nll[pending]
+            trial[:, pending[ok]] = t[:, ok]
+            new_nll[pending[ok]] = t_nll[ok]
+            accepted[pending[ok]] = True
+            pending = pending[~ok]
+
+        params[:, active[accepted]] = trial[:, accepted]
+        step_len[active[accepted]] = a[accepted]
+        last_gain[active] = np.where(accepted, (nll - new_nll) / np.maximum(np.abs(nll), 1.0), np.inf)
+        # assets whose line search failed are left to the polish below
+        converged = small | (accepted & (nll - new_nll <= thresh))
+        status[active[converged]] = "converged"
+        polish.extend(active[~converged & ~accepted])
+        keep = ~converged & accepted
+        if not keep.all():
+            active = active[keep]
+            obj = obj.take(keep)
+
+    # stalled line searches and anything left at maxiter finish with the
+    # single-asset fit(), warm-started from where the batch got to
+    for j in list(active) + polish:
+        m = model_class()
+        res = m.fit(pd.Series(r[:, j]), x0=params[:, j], options=POLISH_OPTIONS)
+        params[:, j] = m.params
+        status[j] = "polished" if res.success else "not_converged"
+
+    nll = full.nll(params)
+    names = list(getattr(model_class, "param_names", range(k)))
+    status = pd.Series(status, index=columns)
+    return {
+        "params": pd.DataFrame(params.T, index=columns, columns=names),
+        "loglik": pd.Series(-nll, index=columns),
+        "sigma2": pd.DataFrame(full.s.copy(), index=index, columns=columns),
+        "status": status,
+        "converged": status == "converged",
+        "nit": nit,
+    }
@@ -24,7 +24,7 @@ class DataGenerator:
     """
     def __init__(self, cfg: DataConfig):
         self.cfg = cfg
-        self.rng = np.random.seed(cfg.seed)
+        self.rng = np.random.default_rng(cfg.seed)
 
     def generate_asset(self):
         cfg = self.cfg
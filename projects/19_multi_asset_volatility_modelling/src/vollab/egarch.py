@@ -1,37 +1,61 @@
-# --- src/vollab/garch.py ---
+# --- src/vollab/egarch.py ---
 
+import math
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
 from .garch_base import GARCHBase
 
-class GARCHModel(GARCHBase):
+E_ABS_Z = math.sqrt(2.0 / math.pi)
+
+class EGARCHModel(GARCHBase):
     """
-    GARCH(1,1):
-    sigma2_t = omega + alpha * r_{t-1}^2 + beta * sigma2_{t-1}
+    EGARCH(1,1) (Nelson), z_t = r_t / sigma_t standard normal:
+    log sigma2_t = omega + alpha * (|z_{t-1}| - E|z|) + gamma * z_{t-1} + beta * log sigma2_{t-1}
     """
+    param_names = ("omega", "alpha", "gamma", "beta")
 
     def _initial_params(self):
-        
-        return np.array([1e-6, 0.05, 0.9])
+        return np.array([-0.5, 0.1, 0.0, 0.95])
 
     def _bounds(self):
-        return [(1e-12, 1.0), (0.0, 2.0), (0.0, 0.9999)]
+        return [(-10.0, 10.0), (-1.0, 2.0), (-1.0, 1.0), (0.0, 0.9999)]
 
     def _compute_sigmas(self, params, returns):
-        omega, alpha, beta = params
+        omega, alpha, gamma, beta = (float(p) for p in params)
         n = len(returns)
-        sigma2 = np.empty(n)
-        
-        sigma2[0] = np.var(returns)
+        log_sigma2 = np.empty(n)
+        # z_{t-1} feeds back into log sigma2_t, so this recursion is not a linear filter
+        ls = math.log(np.var(returns))
+        log_sigma2[0] = ls
         for t in range(1, n):
-            sigma2[t] = omega + alpha * returns[t-1]**2 + beta * sigma2[t-1]
-        
+            z = returns[t-1] / math.exp(0.5 * ls)
+            ls = omega + alpha * (abs(z) - E_ABS_Z) + gamma * z + beta * ls
+            # keep exp() finite during the optimiser's wilder trial steps
+            ls = min(max(ls, -50.0), 50.0)
+            log_sigma2[t] = ls
+
         self._last_return = returns[-1]
-        return sigma2
-
-    def forecast(self, horizon=1):
-        omega, alpha, beta = self.params
-        last_sigma2 = float(self.fitted_sigma2.iloc[-1])
-        last_ret = float(self._last_return)
-        
-        return omega + alpha * last_ret**2 + beta * last_sigma2
+        return np.exp(log_sigma2)
+
+    def _next_sigma2(self, params, sigma2, r):
+        omega, alpha, gamma, beta = params
+        z = r / np.sqrt(sigma2)
+        return np.exp(omega + alpha * (np.abs(z) - E_ABS_Z) + gamma * z + beta * np.log(sigma2))
+
+    def _forecast_path(self, params, sigma2_next, horizons):
+        """
+        E[sigma2_{T+h}] = sigma2_{T+1}^(beta^(h-1)) * exp(omega * sum_{i<h-1} beta^i)
+                          * prod_{i<h-1} E[exp(beta^i * g(z))],
+        g(z) = alpha * (|z| - E|z|) + gamma * z, whose normal mgf is closed form;
+        the product over i is one cumulative sum shared by all horizons.
+        """
+        omega, alpha, gamma, beta = params
+        e = horizons - 1
+        c = beta ** np.arange(e.max())
+        log_mgf = (-c * alpha * E_ABS_Z
+                   + np.logaddexp(0.5 * (c * (alpha + gamma))**2 + norm.logcdf(c * (alpha + gamma)),
+                                  0.5 * (c * (alpha - gamma))**2 + norm.logcdf(c * (alpha - gamma))))
+        cum_log_mgf = np.concatenate([[0.0], np.cumsum(log_mgf)])
+        cum_beta = np.concatenate([[0.0], np.cumsum(c)])
+        return np.exp(beta ** e * np.log(sigma2_next) + omega * cum_beta[e] + cum_log_mgf[e])
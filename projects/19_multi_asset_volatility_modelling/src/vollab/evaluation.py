@@ -3,6 +3,7 @@
 import numpy as np
 import pandas as pd
 from typing import Dict
+from scipy.stats import norm
 
 def rmse(forecast: pd.Series, realised: pd.Series) -> float:
     idx = forecast.dropna().index.intersection(realised.index)
@@ -42,3 +43,70 @@ def evaluate_forecasts(forecasts: Dict[str, pd.Series], realised: pd.Series, mod
             "bic": bic(loglik, k, n)
         })
     return pd.DataFrame(rows).set_index("model")
+
+def _nanmean(x, mask, axis=0):
+    n = mask.sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(mask, x, 0.0).sum(axis=axis) / n
+
+def evaluate_bulk(forecasts, realised, models=None, assets=None, benchmark=0, dm_loss="qlike", dm_lags=0) -> pd.DataFrame:
+    """
+    Score every (model, asset) pair of aligned variance forecasts at once.
+
+    forecasts: (T, n_models, n_assets) array of sigma^2 forecasts
+    realised: (T, n_assets) realised variance proxy (e.g. r_t^2)
+    NaNs (e.g. the rolling warm-up) drop out per pair.
+
+    Losses, averaged over t:
+    - rmse / mae on f - y
+    - qlike = log f + y / f (Patton's robust form up to a constant; finite at y = 0)
+    - mse_log = (log y - log f)^2, over observations with y > 0 only
+    dm_stat / dm_pvalue: Diebold-Mariano test of each model's dm_loss against
+    the benchmark model's, with a Bartlett (Newey-West) long-run variance
+    over dm_lags lags (h - 1 for h-step forecasts; autocovariances in calendar
+    time, gaps contributing zero); negative means the model beats the
+    benchmark. All statistics are computed on whole arrays, with a Python
+    loop only over DM lags.
+
+    Returns a DataFrame indexed by (model, asset).
+    """
+    f = np.asarray(forecasts, dtype=float)
+    y = np.asarray(realised, dtype=float)
+    if f.ndim != 3 or y.shape != (f.shape[0], f.shape[2]):
+        raise ValueError("expected forecasts (T, n_models, n_assets) and realised (T, n_assets)")
+    T, n_models, n_assets = f.shape
+    y = np.broadcast_to(y[:, None, :], f.shape)
+    ok = np.isfinite(f) & np.isfinite(y) & (f > 0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        err = f - y
+        losses = {
+            "rmse": err**2,
+            "mae": np.abs(err),
+            "qlike": np.log(f) + y / f,
+            "mse_log": (np.log(y) - np.log(f))**2,
+        }
+    masks = {"rmse": ok, "mae": ok, "qlike": ok, "mse_log": ok & (y > 0)}
+    out = {name: _nanmean(loss, masks[name]) for name, loss in losses.items()}
+    out["rmse"] = np.sqrt(out["rmse"])
+    out["n_obs"] = ok.sum(axis=0)
+
+    # Diebold-Mariano on the loss differential vs the benchmark, on common dates
+    both = masks[dm_loss] & masks[dm_loss][:, [benchmark], :]
+    d = np.where(both, losses[dm_loss] - losses[dm_loss][:, [benchmark], :], 0.0)
+    n = both.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        d_bar = d.sum(axis=0) / n
+        u = np.where(both, d - d_bar, 0.0)
+        lrv = (u * u).sum(axis=0) / n
+        for lag in range(1, dm_lags + 1):
+            lrv += 2.0 * (1.0 - lag / (dm_lags + 1)) * (u[lag:] * u[:-lag]).sum(axis=0) / n
+        dm = d_bar / np.sqrt(lrv / n)
+    dm[benchmark] = np.nan
+    out["dm_stat"] = dm
+    out["dm_pvalue"] = 2.0 * norm.sf(np.abs(dm))
+
+    models = list(models) if models is not None else list(range(n_models))
+    assets = list(assets) if assets is not None else list(range(n_assets))
+    index = pd.MultiIndex.from_product([models, assets], names=["model", "asset"])
+    return pd.DataFrame({k: np.asarray(v).ravel() for k, v in out.items()}, index=index)
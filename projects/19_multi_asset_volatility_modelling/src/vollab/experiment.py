@@ -2,7 +2,7 @@
 # --- src/vollab/experiment.py ---
 
 import pandas as pd
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from .data import DataConfig, DataGenerator
 from .cleaning import clean_returns
 from .garch import GARCHModel
@@ -12,66 +12,97 @@ from .forecast import rolling_forecast
 from .evaluation import evaluate_forecasts
 import os
 
-def run_experiment(outdir="vol_output", window=500):
-    os.makedirs(outdir, exist_ok=True)
-    cfg = DataConfig()
-    gen = DataGenerator(cfg)
-    assets = gen.generate()
-
-    results = {}
-    for name, df in assets.items():
-        dfc = clean_returns(df)
-        returns = dfc["return"]
+MODELS = {"GARCH": GARCHModel, "EGARCH": EGARCHModel, "GJR": GJRModel}
 
-        realised = returns**2
+def _forecast_task(returns: pd.Series, model_name: str, window: int, refit_every: int):
+    """One (asset, model) rolling forecast; the final window's fit doubles as models_info."""
+    fc, info = rolling_forecast(returns, model_class=MODELS[model_name], window=window,
+                                refit_every=refit_every, return_info=True)
+    last = info["last_fit"]
+    return fc, {"loglik": last["loglik"], "k": last["k"], "n": last["n"]}
 
-        forecasts = {}
-        models_info = {}
+def _plot_forecasts(name, forecasts, realised, fpath):
+    # runs in the plotting worker process, off the forecasting critical path
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
-        fc_garch = rolling_forecast(returns, model_class=GARCHModel, window=window)
-        forecasts["GARCH"] = fc_garch
+    # save plot: forecasts vs realised for last 200 points
+    plt.figure(figsize=(10, 6))
+    for k, v in forecasts.items():
+        plt.plot(v.index[-200:], v.values[-200:], label=f"{k} forecast")
+    plt.plot(realised.index[-200:], realised.values[-200:], label="realised", color="k", linewidth=1)
+    plt.legend()
+    plt.title(f"{name} -- forecasts vs realised (last 200)")
+    plt.tight_layout()
+    plt.savefig(fpath)
+    plt.close()
+    return fpath
 
-        gm = GARCHModel()
-        gm.fit(returns.iloc[-window:])
-        models_info["GARCH"] = {"loglik": gm.loglik, "k": len(gm.params), "n": gm.nobs}
+def run_experiment(outdir="vol_output", window=500, cfg=None, n_workers=None, refit_every=1):
+    """
+    Rolling GARCH / EGARCH / GJR forecasts for every asset.
 
-        fc_egarch = rolling_forecast(returns, model_class=EGARCHModel, window=window)
-        forecasts["EGARCH"] = fc_egarch
-        eg = EGARCHModel()
-        eg.fit(returns.iloc[-window:])
-        models_info["EGARCH"] = {"loglik": eg.loglik, "k": len(eg.params), "n": eg.nobs}
+    The (asset, model) cross-product runs on a process pool of n_workers
+    (default os.cpu_count(); 1 runs in-process). Information criteria reuse
+    the last rolling fit instead of refitting the final window, and plots
+    are rendered by a separate background process while forecasts run.
+    """
+    os.makedirs(outdir, exist_ok=True)
+    cfg = cfg if cfg is not None else DataConfig()
+    gen = DataGenerator(cfg)
+    assets = gen.generate()
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
 
-        fc_gjr = rolling_forecast(returns, model_class=GJRModel, window=window)
-        forecasts["GJR"] = fc_gjr
-        gj = GJRModel()
-        gj.fit(returns.iloc[-window:])
-        models_info["GJR"] = {"loglik": gj.loglik, "k": len(gj.params), "n": gj.nobs}
+    returns = {}
+    for name, df in assets.items():
+        dfc = clean_returns(df)
+        returns[name] = dfc["return"]
 
-        eval_df = evaluate_forecasts(forecasts, realised, models_info)
+    forecasts = {name: {} for name in assets}
+    models_info = {name: {} for name in assets}
+    results = {}
+    plots = []
 
-        # save plot: forecasts vs realised for last 200 points
-        plt.figure(figsize=(10, 6))
-        last = returns.index[-200:]
-        for k, v in forecasts.items():
-            plt.plot(v.index[-200:], v.values[-200:], label=f"{k} forecast")
-        plt.plot(realised.index[-200:], realised.values[-200:], label="realised", color="k", linewidth=1)
-        plt.legend()
-        plt.title(f"{name} -- forecasts vs realised (last 200)")
-        plt.tight_layout()
+    def finish_asset(name, plotter):
+        realised = returns[name]**2
+        # keep the model order stable regardless of completion order
+        fcs = {m: forecasts[name][m] for m in MODELS}
+        infos = {m: models_info[name][m] for m in MODELS}
+        eval_df = evaluate_forecasts(fcs, realised, infos)
         fpath = os.path.join(outdir, f"{name}_forecasts_vs_realised.png")
-        plt.savefig(fpath)
-        plt.close()
-
+        plots.append(plotter.submit(_plot_forecasts, name, fcs, realised, fpath))
         results[name] = {
             "eval": eval_df,
-            "forecasts": forecasts,
-            "models_info": models_info,
+            "forecasts": fcs,
+            "models_info": infos,
             "realised": realised
         }
 
+    with ProcessPoolExecutor(max_workers=1) as plotter:
+        if n_workers == 1:
+            for name in assets:
+                for model_name in MODELS:
+                    fc, info = _forecast_task(returns[name], model_name, window, refit_every)
+                    forecasts[name][model_name] = fc
+                    models_info[name][model_name] = info
+                finish_asset(name, plotter)
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = {pool.submit(_forecast_task, returns[name], model_name, window, refit_every): (name, model_name)
+                           for name in assets for model_name in MODELS}
+                for fut in as_completed(futures):
+                    name, model_name = futures[fut]
+                    forecasts[name][model_name], models_info[name][model_name] = fut.result()
+                    if len(forecasts[name]) == len(MODELS):
+                        finish_asset(name, plotter)
+        for p in plots:
+            p.result()
+
     summary_rows = []
-    for asset, info in results.items():
-        dfm = info["eval"]
+    for asset in assets:
+        dfm = results[asset]["eval"]
         for model in dfm.index:
             row = dfm.loc[model].to_dict()
             row["asset"] = asset
@@ -4,19 +4,44 @@ import pandas as pd
 from typing import Dict
 from tqdm import tqdm
 
-def rolling_forecast(asset_returns: pd.Series, model_class, window: int = 400):
+def rolling_forecast(asset_returns: pd.Series, model_class, window: int = 400,
+                     refit_every: int = 1, warm_start: bool = True, return_info: bool = False):
     """
     Fit model on rolling in-sample window and produce 1-step-ahead variance forecasts.
     Returns a pd.Series of forecasts aligned to the forecasted date (i.e., forecast for t+1 stored at index t+1).
+
+    refit_every=k refits only every k days; in between, the last fit's
+    params are kept and the variance is filtered forward one return at a
+    time (model.update). warm_start starts each refit from the previous
+    window's params instead of _initial_params(). With return_info=True a
+    (forecasts, info) tuple is returned, info holding the number of fits,
+    the optimiser's total iterations / function evaluations and, under
+    "last_fit", the loglik / k / n / params of the final window's fit.
     """
     n = len(asset_returns)
     forecasts = pd.Series(index=asset_returns.index, dtype=float)
-    
+    r = asset_returns.values
+    refit_every = max(1, int(refit_every))
+    info = {"n_fits": 0, "nit": 0, "nfev": 0}
+
+    m = None
+    prev_params = None
     for end in range(window, n):
-        insample = asset_returns.iloc[end-window:end]
-        m = model_class()
-        res = m.fit(insample)
+        if (end - window) % refit_every == 0:
+            insample = asset_returns.iloc[end-window:end]
+            m = model_class()
+            res = m.fit(insample, x0=prev_params if warm_start else None)
+            prev_params = m.params
+            info["n_fits"] += 1
+            info["nit"] += int(getattr(res, "nit", 0))
+            info["nfev"] += int(getattr(res, "nfev", 0))
+        else:
+            m.update(r[end-1])
         f = m.forecast(horizon=1)
         
         forecasts.iloc[end] = f
+    if return_info:
+        if m is not None:
+            info["last_fit"] = {"loglik": m.loglik, "k": len(m.params), "n": m.nobs, "params": m.params}
+        return forecasts, info
     return forecasts
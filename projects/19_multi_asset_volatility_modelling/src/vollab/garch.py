@@ -2,13 +2,14 @@
 
 import numpy as np
 import pandas as pd
-from .garch_base import GARCHBase
+from .garch_base import GARCHBase, variance_filter, affine_forecast_path
 
 class GARCHModel(GARCHBase):
     """
     GARCH(1,1):
     sigma2_t = omega + alpha * r_{t-1}^2 + beta * sigma2_{t-1}
     """
+    param_names = ("omega", "alpha", "beta")
 
     def _initial_params(self):
         
@@ -19,19 +20,45 @@ class GARCHModel(GARCHBase):
 
     def _compute_sigmas(self, params, returns):
         omega, alpha, beta = params
-        n = len(returns)
-        sigma2 = np.empty(n)
-        
-        sigma2[0] = np.var(returns)
-        for t in range(1, n):
-            sigma2[t] = omega + alpha * returns[t-1]**2 + beta * sigma2[t-1]
+        x = np.empty(len(returns))
+        x[1:] = omega + alpha * returns[:-1]**2
+        sigma2 = variance_filter(x, beta, np.var(returns))
         
         self._last_return = returns[-1]
         return sigma2
 
-    def forecast(self, horizon=1):
-        omega, alpha, beta = self.params
-        last_sigma2 = float(self.fitted_sigma2.iloc[-1])
-        last_ret = float(self._last_return)
-        
-        return omega + alpha * last_ret**2 + beta * last_sigma2
+    def _sigma2_grad(self, params, returns):
+        omega, alpha, beta = params
+        n = len(returns)
+        r2_lag = np.zeros(n)
+        r2_lag[1:] = returns[:-1]**2
+        sigma2 = variance_filter(omega + alpha * r2_lag, beta, np.var(returns))
+
+        # d sigma2_t = d(omega, alpha, beta) inputs + beta * d sigma2_{t-1}; sigma2_0 is fixed
+        sig_lag = np.zeros(n)
+        sig_lag[1:] = sigma2[:-1]
+        dsigma2 = variance_filter(np.vstack([np.ones(n), r2_lag, sig_lag]), beta, 0.0)
+
+        self._last_return = returns[-1]
+        return sigma2, dsigma2
+
+    def _batch_initial_params(self, returns):
+        # _initial_params' alpha / beta, with omega targeting each asset's sample variance
+        params = super()._batch_initial_params(returns)
+        params[0] = returns.var(axis=0) * (1.0 - params[1] - params[2])
+        return params
+
+    def _batch_design(self, returns):
+        # x_t = omega * 1 + alpha * r_{t-1}^2, one column per asset; row 0 is unused
+        X = np.zeros((returns.shape[0], 2, returns.shape[1]))
+        X[1:, 0] = 1.0
+        X[1:, 1] = returns[:-1]**2
+        return X
+
+    def _next_sigma2(self, params, sigma2, r):
+        omega, alpha, beta = params
+        return omega + alpha * r**2 + beta * sigma2
+
+    def _forecast_path(self, params, sigma2_next, horizons):
+        omega, alpha, beta = params
+        return affine_forecast_path(omega, alpha + beta, sigma2_next, horizons)
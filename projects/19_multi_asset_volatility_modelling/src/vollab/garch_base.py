@@ -4,6 +4,75 @@ import numpy as np
 import pandas as pd
 from typing import Dict
 from scipy.optimize import minimize
+from scipy.signal import lfilter
+
+
+def variance_filter(x: np.ndarray, beta: float, first: np.ndarray) -> np.ndarray:
+    """
+    y_t = x_t + beta * y_{t-1} along the last axis with y_0 = first, i.e. the
+    GARCH-type variance recursion (and the recursions of its derivatives)
+    run as a first-order linear filter in C instead of a Python loop.
+    x[..., 0] is ignored.
+    """
+    x = np.array(x, dtype=float)
+    x[..., 0] = first
+    return lfilter([1.0], [1.0, -beta], x, axis=-1)
+
+
+def _horizons(horizons) -> np.ndarray:
+    h = np.atleast_1d(np.asarray(horizons, dtype=int))
+    if (h < 1).any():
+        raise ValueError("horizons must be >= 1")
+    return h
+
+
+def affine_forecast_path(omega, persistence, sigma2_next, horizons) -> np.ndarray:
+    """
+    Closed-form E[sigma2_{T+h}] for models whose variance forecasts follow
+    E_t[sigma2_{t+1}] = omega + persistence * sigma2_t (GARCH; GJR under
+    symmetric innovations):
+        omega * (1 - p^(h-1)) / (1 - p) + p^(h-1) * sigma2_{T+1}
+    for every horizon at once (omega * (h-1) + sigma2_{T+1} when p = 1).
+    omega / persistence / sigma2_next may be per-asset arrays; the result
+    has shape (len(horizons),) + their broadcast shape.
+    """
+    shape = np.broadcast(omega, persistence, sigma2_next).shape
+    e = (_horizons(horizons) - 1).reshape((-1,) + (1,) * len(shape))
+    p = np.asarray(persistence, dtype=float)
+    unit = np.isclose(p, 1.0)
+    p_h = p ** e
+    geo = np.where(unit, e, (1.0 - p_h) / np.where(unit, 1.0, 1.0 - p))
+    return omega * geo + p_h * sigma2_next
+
+
+# below this many series lfilter per column beats a Python loop over time
+_LFILTER_COLUMNS = 128
+
+def batch_variance_filter(x: np.ndarray, beta: np.ndarray, first, out=None) -> np.ndarray:
+    """
+    Cross-asset variance_filter: y_t = x_t + beta * y_{t-1} along axis 0 (time)
+    with one beta per asset on the last axis, y_0 = first. lfilter only takes
+    a scalar beta, so wide panels loop over time once, vectorised over every
+    asset (and any middle axes, e.g. derivative components); narrow ones
+    (fewer than _LFILTER_COLUMNS series) run lfilter column by column.
+    x[0] is ignored. out (which may be x itself) receives the result in place.
+    """
+    if out is None:
+        y = np.array(x, dtype=float)
+    else:
+        y = out
+        if y is not x:
+            y[...] = x
+    y[0] = first
+    cols = y.reshape(len(y), -1)
+    if cols.shape[1] < _LFILTER_COLUMNS:
+        b = np.broadcast_to(beta, y.shape[1:]).ravel()
+        for j in range(cols.shape[1]):
+            cols[:, j] = lfilter([1.0], [1.0, -b[j]], cols[:, j])
+        return cols.reshape(y.shape)
+    for t in range(1, len(y)):
+        y[t] += beta * y[t-1]
+    return y
 
 class GARCHBase:
     """
@@ -11,12 +80,33 @@ class GARCHBase:
     - _compute_sigmas(params, returns) -> array of sigma2
     - _initial_params() -> starting parameter array
     - _bounds() -> bounds for optimiser
+    and may implement:
+    - _sigma2_grad(params, returns) -> (sigma2, dsigma2/dparams of shape (k, n))
+      to fit with analytic gradients instead of finite differences
+    - _next_sigma2(params, sigma2, r) -> one-step variance update, which
+      enables update() and the default forecast()
+    - _forecast_path(params, sigma2_next, horizons) -> closed-form h-step
+      variance forecasts given the one-step one, which enables forecast_path()
+      and multi-step forecast(horizon)
+    - _batch_design(returns) -> (n_obs, k-1, n_assets) regressors X for models
+      with sigma2_t = params[:-1] . X_t + beta * sigma2_{t-1} (beta last),
+      which enables vollab.batch.fit_batch
+    - _batch_initial_params(returns) -> (k, n_assets) starting params for fit_batch
     """
 
-    def fit(self, returns: pd.Series, method="L-BFGS-B", options=None):
+    def fit(self, returns: pd.Series, method="L-BFGS-B", options=None, x0=None):
+        """
+        Maximum-likelihood fit. x0 warm-starts the optimiser (e.g. from the
+        previous window's params); it is clipped into the bounds.
+        """
         r = returns.values
-        x0 = self._initial_params()
         bounds = self._bounds()
+        if x0 is None:
+            x0 = self._initial_params()
+        else:
+            lo = [b[0] for b in bounds]
+            hi = [b[1] for b in bounds]
+            x0 = np.clip(np.asarray(x0, dtype=float), lo, hi)
         if options is None:
             options = {"maxiter": 200}
         
@@ -28,7 +118,11 @@ class GARCHBase:
             ll = -0.5 * (np.log(2 * np.pi) + np.log(sigma2) + (r ** 2) / sigma2)
             return -np.sum(ll)
 
-        res = minimize(nll, x0, method=method, bounds=bounds, options=options)
+        if self._has_gradient():
+            res = minimize(self._nll_and_grad, x0, args=(r,), jac=True, method=method,
+                           bounds=bounds, options=options)
+        else:
+            res = minimize(nll, x0, method=method, bounds=bounds, options=options)
         if not res.success:
             
             pass
@@ -36,6 +130,7 @@ class GARCHBase:
         self.nll = res.fun
         
         self.fitted_sigma2 = pd.Series(self._compute_sigmas(self.params, r), index=returns.index)
+        self._last_sigma2 = float(self.fitted_sigma2.iloc[-1])
         
         self.nobs = len(r)
         self.loglik = -res.fun
@@ -43,16 +138,68 @@ class GARCHBase:
 
     def forecast(self, horizon: int = 1) -> float:
         """
-        Produce 1-step ahead forecast of sigma^2 using last observed returns.
-        For horizon>1 subclasses may override.
+        Produce the horizon-step ahead forecast of sigma^2 from the last observed
+        return. Models without _forecast_path only support horizon=1.
         """
+        if type(self)._forecast_path is not GARCHBase._forecast_path:
+            return float(self.forecast_path([horizon])[0])
         # default: use fitted params and last known sigma2
-        last_sigma2 = float(self.fitted_sigma2.iloc[-1])
-        last_ret = float(self._last_return) if hasattr(self, "_last_return") else 0.0
+        last_sigma2 = self._last_sigma2
+        if type(self)._next_sigma2 is not GARCHBase._next_sigma2:
+            return float(self._next_sigma2(self.params, last_sigma2, self._last_return))
         # need subclass to implement explicit forecast; fallback: return last_sigma2
         return last_sigma2
 
+    def forecast_path(self, horizons) -> np.ndarray:
+        """
+        sigma^2 forecasts for every horizon in horizons (1 = next step) in one
+        vectorised closed-form evaluation, e.g. forecast_path(np.arange(1, 251)).
+        """
+        sigma2_next = self._next_sigma2(self.params, self._last_sigma2, self._last_return)
+        return self._forecast_path(self.params, sigma2_next, _horizons(horizons))
+
+    def update(self, r: float):
+        """
+        Filter the variance forward by one observation with the current params
+        (no refit): afterwards forecast() is the one-step forecast past r.
+        """
+        self._last_sigma2 = float(self._next_sigma2(self.params, self._last_sigma2, self._last_return))
+        self._last_return = float(r)
+
+    def _has_gradient(self) -> bool:
+        return type(self)._sigma2_grad is not GARCHBase._sigma2_grad
+
+    def _nll_and_grad(self, params, r):
+        """Negative log-likelihood and its analytic gradient in one pass."""
+        sigma2, dsigma2 = self._sigma2_grad(params, r)
+        clipped = sigma2 < 1e-12
+        sigma2 = np.maximum(sigma2, 1e-12)
+        r2 = r ** 2
+        nll = 0.5 * np.sum(np.log(2 * np.pi) + np.log(sigma2) + r2 / sigma2)
+        # d nll / d sigma2_t, zero where the floor is active
+        g = 0.5 * (1.0 / sigma2 - r2 / sigma2 ** 2)
+        g[clipped] = 0.0
+        return nll, dsigma2 @ g
+
+    def _has_batch_recursion(self) -> bool:
+        return type(self)._batch_design is not GARCHBase._batch_design
+
     # placeholder methods: override in subclasses
+    def _sigma2_grad(self, params, returns):
+        raise NotImplementedError
+
+    def _batch_initial_params(self, returns):
+        return np.repeat(np.asarray(self._initial_params(), dtype=float)[:, None], returns.shape[1], axis=1)
+
+    def _batch_design(self, returns):
+        raise NotImplementedError
+
+    def _next_sigma2(self, params, sigma2, r):
+        raise NotImplementedError
+
+    def _forecast_path(self, params, sigma2_next, horizons):
+        raise NotImplementedError
+
     def _compute_sigmas(self, params, returns):
         raise NotImplementedError
 
@@ -2,13 +2,14 @@
 
 import numpy as np
 import pandas as pd
-from .garch_base import GARCHBase
+from .garch_base import GARCHBase, variance_filter, affine_forecast_path
 
 class GJRModel(GARCHBase):
     """
     GJR-GARCH(1,1):
     sigma2_t = omega + alpha * r_{t-1}^2 + gamma * r_{t-1}^2 * I_{r_{t-1} < 0} + beta * sigma2_{t-1}
     """
+    param_names = ("omega", "alpha", "gamma", "beta")
 
     def _initial_params(self):
         return np.array([1e-6, 0.05, 0.05, 0.9])
@@ -18,18 +19,48 @@ class GJRModel(GARCHBase):
 
     def _compute_sigmas(self, params, returns):
         omega, alpha, gamma, beta = params
-        n = len(returns)
-        sigma2 = np.empty(n)
-        sigma2[0] = np.var(returns)
-        for t in range(1, n):
-            ind = 1.0 if returns[t-1] < 0 else 0.0
-            sigma2[t] = omega + alpha * returns[t-1]**2 + gamma * returns[t-1]**2 * ind + beta * sigma2[t-1]
+        r_lag = returns[:-1]
+        x = np.empty(len(returns))
+        x[1:] = omega + alpha * r_lag**2 + gamma * r_lag**2 * (r_lag < 0)
+        sigma2 = variance_filter(x, beta, np.var(returns))
         self._last_return = returns[-1]
         return sigma2
 
-    def forecast(self, horizon=1):
-        omega, alpha, gamma, beta = self.params
-        last_sigma2 = float(self.fitted_sigma2.iloc[-1])
-        last_ret = float(self._last_return)
-        ind = 1.0 if last_ret < 0 else 0.0
-        return omega + alpha * last_ret**2 + gamma * last_ret**2 * ind + beta * last_sigma2
+    def _sigma2_grad(self, params, returns):
+        omega, alpha, gamma, beta = params
+        n = len(returns)
+        r2_lag = np.zeros(n)
+        r2_lag[1:] = returns[:-1]**2
+        neg_lag = np.zeros(n)
+        neg_lag[1:] = r2_lag[1:] * (returns[:-1] < 0)
+        sigma2 = variance_filter(omega + alpha * r2_lag + gamma * neg_lag, beta, np.var(returns))
+
+        sig_lag = np.zeros(n)
+        sig_lag[1:] = sigma2[:-1]
+        dsigma2 = variance_filter(np.vstack([np.ones(n), r2_lag, neg_lag, sig_lag]), beta, 0.0)
+
+        self._last_return = returns[-1]
+        return sigma2, dsigma2
+
+    def _batch_initial_params(self, returns):
+        params = super()._batch_initial_params(returns)
+        params[0] = returns.var(axis=0) * (1.0 - params[1] - 0.5 * params[2] - params[3])
+        return params
+
+    def _batch_design(self, returns):
+        r_lag = returns[:-1]
+        X = np.zeros((returns.shape[0], 3, returns.shape[1]))
+        X[1:, 0] = 1.0
+        X[1:, 1] = r_lag**2
+        X[1:, 2] = r_lag**2 * (r_lag < 0)
+        return X
+
+    def _next_sigma2(self, params, sigma2, r):
+        omega, alpha, gamma, beta = params
+        ind = 1.0 if r < 0 else 0.0
+        return omega + alpha * r**2 + gamma * r**2 * ind + beta * sigma2
+
+    def _forecast_path(self, params, sigma2_next, horizons):
+        # with symmetric innovations r_t < 0 half the time
+        omega, alpha, gamma, beta = params
+        return affine_forecast_path(omega, alpha + 0.5 * gamma + beta, sigma2_next, horizons)
@@ -0,0 +1,126 @@
+# --- src/vollab/streaming.py ---
+
+import threading
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from .garch_base import _horizons
+
+class StreamingFilter:
+    """
+    Live conditional-variance filter on top of a fitted vollab model.
+
+    sigma2 is the variance of the next, not yet seen, return; update(r_t)
+    advances it by one _next_sigma2 step (O(1), no history pass). The last
+    `window` returns are kept so that every refit_every updates (or on
+    refit()) the model is refitted in a background thread, warm-started
+    from the current params. When the refit lands, the returns that arrived
+    meanwhile are filtered through the new params and (model, sigma2) are
+    swapped in under the same lock update() takes, so readers never see new
+    params paired with an old state.
+    """
+
+    def __init__(self, model, window=500, refit_every=None, history=None, sigma2=None, executor=None):
+        self.model = model
+        self.window = int(window)
+        self.refit_every = refit_every
+        self._history = deque(np.asarray(history if history is not None else [], dtype=float)[-self.window:],
+                              maxlen=self.window)
+        if sigma2 is None:
+            sigma2 = model._next_sigma2(model.params, model._last_sigma2, model._last_return)
+        self._sigma2 = float(sigma2)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+        self._pending = None
+        self._idle = threading.Event()
+        self._idle.set()
+        self._since_snapshot = []
+        self.n_updates = 0
+        self.n_refits = 0
+        self.last_refit_error = None
+
+    @classmethod
+    def from_params(cls, model_class, params, sigma2, **kwargs):
+        """Filter from stored params and the current one-step variance, without a fit."""
+        model = model_class()
+        model.params = np.asarray(params, dtype=float)
+        return cls(model, sigma2=sigma2, **kwargs)
+
+    @property
+    def sigma2(self) -> float:
+        return self._sigma2
+
+    @property
+    def params(self) -> np.ndarray:
+        return self.model.params
+
+    def update(self, r: float) -> float:
+        """Advance the filter by one return; returns the new one-step variance forecast."""
+        r = float(r)
+        with self._lock:
+            sigma2 = float(self.model._next_sigma2(self.model.params, self._sigma2, r))
+            self._sigma2 = sigma2
+            self._history.append(r)
+            if self._pending is not None:
+                self._since_snapshot.append(r)
+            self.n_updates += 1
+            due = bool(self.refit_every) and self.n_updates % self.refit_every == 0
+        if due:
+            self.refit()
+        return sigma2
+
+    def forecast_path(self, horizons) -> np.ndarray:
+        """Closed-form sigma^2 forecasts for every horizon (1 = next return) from the current state."""
+        with self._lock:
+            model, sigma2 = self.model, self._sigma2
+        return model._forecast_path(model.params, sigma2, _horizons(horizons))
+
+    def refit(self):
+        """
+        Refit on the buffered window in the background; returns the Future.
+        A refit already in flight is returned instead of starting another.
+        """
+        with self._lock:
+            if self._pending is not None:
+                return self._pending
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            sample = pd.Series(np.array(self._history))
+            self._since_snapshot = []
+            self._idle.clear()
+            fut = self._executor.submit(self._fit, type(self.model), sample, self.model.params)
+            self._pending = fut
+        fut.add_done_callback(self._swap)
+        return fut
+
+    def wait(self):
+        """Block until the in-flight refit (if any) has been swapped in."""
+        self._idle.wait()
+
+    def close(self):
+        self.wait()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+
+    @staticmethod
+    def _fit(model_class, sample, x0):
+        m = model_class()
+        m.fit(sample, x0=x0)
+        return m
+
+    def _swap(self, fut):
+        err = fut.exception()
+        with self._lock:
+            if err is None:
+                m = fut.result()
+                sigma2 = m._next_sigma2(m.params, m._last_sigma2, m._last_return)
+                for r in self._since_snapshot:
+                    sigma2 = m._next_sigma2(m.params, sigma2, r)
+                self.model, self._sigma2 = m, float(sigma2)
+                self.n_refits += 1
+            self.last_refit_error = err
+            self._since_snapshot = []
+            self._pending = None
+            self._idle.set()
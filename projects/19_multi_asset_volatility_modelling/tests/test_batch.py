@@ -0,0 +1,46 @@
+# --- tests/test_batch.py ---
+
+import numpy as np
+import pandas as pd
+from src.vollab.batch import fit_batch, POLISH_OPTIONS
+from src.vollab.garch import GARCHModel
+from src.vollab.gjr import GJRModel
+from src.vollab.garch_base import batch_variance_filter
+
+def _simulate_panel(n, m, seed=0):
+    rng = np.random.default_rng(seed)
+    eps = rng.standard_normal((n, m))
+    omega = 1e-6 * rng.uniform(0.5, 2.0, m)
+    alpha = rng.uniform(0.03, 0.1, m)
+    beta = rng.uniform(0.8, 0.88, m)
+    sigma2 = np.empty((n, m))
+    sigma2[0] = omega / (1 - alpha - beta)
+    for t in range(1, n):
+        sigma2[t] = omega + alpha * sigma2[t-1] * eps[t-1]**2 + beta * sigma2[t-1]
+    idx = pd.date_range("2000-01-01", periods=n, freq="B")
+    return pd.DataFrame(np.sqrt(sigma2) * eps, index=idx, columns=[f"a{i}" for i in range(m)])
+
+def test_batch_variance_filter_matches_per_column_lfilter():
+    rng = np.random.default_rng(0)
+    # 150 series runs the loop over time, one at a time runs lfilter
+    x = rng.uniform(size=(50, 3, 50))
+    beta = rng.uniform(0.5, 0.95, 50)
+    wide = batch_variance_filter(x, beta, 0.1)
+    narrow = np.concatenate([batch_variance_filter(x[..., j:j+1], beta[j:j+1], 0.1) for j in range(50)], axis=-1)
+    np.testing.assert_allclose(wide, narrow, rtol=1e-12)
+
+def test_fit_batch_matches_single_asset_fits():
+    panel = _simulate_panel(600, 6)
+    for cls in (GARCHModel, GJRModel):
+        out = fit_batch(panel, cls)
+        assert list(out["params"].columns) == list(cls.param_names)
+        assert out["status"].isin(["converged", "polished"]).all()
+        assert (out["converged"] == (out["status"] == "converged")).all()
+        for name in panel.columns:
+            params = out["params"].loc[name].to_numpy()
+            m = cls()
+            m.fit(panel[name], x0=params, options=POLISH_OPTIONS)
+            # a tight single-asset fit from the batch params finds nothing more
+            assert m.loglik - out["loglik"][name] < 1e-4
+            np.testing.assert_allclose(out["sigma2"][name].to_numpy(),
+                                       m._compute_sigmas(params, panel[name].to_numpy()), rtol=1e-10)
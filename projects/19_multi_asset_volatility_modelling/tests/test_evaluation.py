@@ -0,0 +1,44 @@
+# --- tests/test_evaluation.py ---
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from src.vollab.evaluation import evaluate_bulk, rmse, mae
+
+def test_evaluate_bulk_matches_per_pair_computation():
+    rng = np.random.default_rng(4)
+    T, n_models, n_assets = 300, 3, 4
+    true = rng.uniform(1e-5, 4e-4, size=(T, n_assets))
+    realised = true * rng.standard_normal((T, n_assets))**2
+    realised[5, 1] = 0.0
+    f = true[:, None, :] * rng.uniform(0.7, 1.3, size=(T, n_models, n_assets))
+    f[:20] = np.nan                      # rolling warm-up
+    f[50:60, 2, 3] = np.nan
+
+    out = evaluate_bulk(f, realised, models=["A", "B", "C"], benchmark=0, dm_lags=2)
+    assert out.shape[0] == n_models * n_assets
+    idx = pd.RangeIndex(T)
+    for mi, model in enumerate(["A", "B", "C"]):
+        for a in range(n_assets):
+            row = out.loc[(model, a)]
+            fs, ys = pd.Series(f[:, mi, a], index=idx), pd.Series(realised[:, a], index=idx)
+            assert np.isclose(row["rmse"], rmse(fs, ys))
+            assert np.isclose(row["mae"], mae(fs, ys))
+            ok = ~np.isnan(f[:, mi, a])
+            assert np.isclose(row["qlike"], np.mean(np.log(f[ok, mi, a]) + realised[ok, a] / f[ok, mi, a]))
+            pos = ok & (realised[:, a] > 0)
+            assert np.isclose(row["mse_log"], np.mean((np.log(realised[pos, a]) - np.log(f[pos, mi, a]))**2))
+
+            if mi == 0:
+                assert np.isnan(row["dm_stat"])
+                continue
+            common = ok & ~np.isnan(f[:, 0, a])
+            loss = lambda g: np.log(g) + realised[common, a] / g
+            d = loss(f[common, mi, a]) - loss(f[common, 0, a])
+            # autocovariances are taken in calendar time, gaps contributing zero
+            u = np.zeros(T)
+            u[common] = d - d.mean()
+            lrv = u @ u / len(d) + sum(2 * (1 - l / 3) * (u[l:] @ u[:-l]) / len(d) for l in (1, 2))
+            stat = d.mean() / np.sqrt(lrv / len(d))
+            assert np.isclose(row["dm_stat"], stat)
+            assert np.isclose(row["dm_pvalue"], 2 * norm.sf(abs(stat)))
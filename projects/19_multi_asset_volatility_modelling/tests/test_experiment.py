@@ -0,0 +1,15 @@
+# --- tests/test_experiment.py ---
+
+import numpy as np
+from src.vollab.data import DataConfig
+from src.vollab.experiment import run_experiment
+
+def test_run_experiment_parallel_matches_serial(tmp_path):
+    cfg = DataConfig(n_assets=2, n_steps=260)
+    serial = run_experiment(outdir=tmp_path / "serial", window=240, cfg=cfg, n_workers=1)
+    parallel = run_experiment(outdir=tmp_path / "parallel", window=240, cfg=cfg, n_workers=2)
+
+    assert serial["summary"].shape[0] == 6
+    np.testing.assert_allclose(serial["summary"].values, parallel["summary"].values)
+    assert (tmp_path / "parallel" / "asset_1_forecasts_vs_realised.png").exists()
+    assert (tmp_path / "parallel" / "summary_metrics.csv").exists()
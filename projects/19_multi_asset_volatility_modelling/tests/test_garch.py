@@ -3,6 +3,7 @@
 import numpy as np
 import pandas as pd
 from src.vollab.garch import GARCHModel
+from src.vollab.gjr import GJRModel
 
 def test_garch_fit_and_positive_sigma():
     rng = np.random.default_rng(1)
@@ -13,3 +14,79 @@ def test_garch_fit_and_positive_sigma():
     res = m.fit(s)
     assert hasattr(m, "params")
     assert (m.fitted_sigma2 > 0).all()
+
+
+class _FiniteDiffGARCH(GARCHModel):
+    def _has_gradient(self):
+        return False
+
+
+class _FiniteDiffGJR(GJRModel):
+    def _has_gradient(self):
+        return False
+
+
+def test_analytic_gradient_and_fit_match_finite_differences():
+    rng = np.random.default_rng(3)
+    r = rng.normal(scale=0.01, size=800) * (1 + 0.5 * np.sin(np.arange(800) / 50))
+    idx = pd.date_range("2000-01-01", periods=800, freq="B")
+    s = pd.Series(r, index=idx)
+    for fast_cls, slow_cls, p in [(GARCHModel, _FiniteDiffGARCH, np.array([2e-6, 0.08, 0.85])),
+                                  (GJRModel, _FiniteDiffGJR, np.array([2e-6, 0.05, 0.06, 0.85]))]:
+        m = fast_cls()
+        nll, grad = m._nll_and_grad(p, r)
+        step = p * 1e-6
+        for i in range(len(p)):
+            up, dn = p.copy(), p.copy()
+            up[i] += step[i]
+            dn[i] -= step[i]
+            fd = (m._nll_and_grad(up, r)[0] - m._nll_and_grad(dn, r)[0]) / (2 * step[i])
+            assert abs(grad[i] - fd) <= 1e-5 * max(1.0, abs(fd))
+
+        fast, slow = fast_cls(), slow_cls()
+        fast.fit(s)
+        slow.fit(s)
+        assert abs(fast.loglik - slow.loglik) < 1e-3 * abs(slow.loglik)
+        np.testing.assert_allclose(fast.params[1:], slow.params[1:], atol=2e-2)
+
+
+def test_forecast_path_matches_iterated_expectations():
+    rng = np.random.default_rng(5)
+    idx = pd.date_range("2000-01-01", periods=600, freq="B")
+    s = pd.Series(rng.normal(scale=0.01, size=600), index=idx)
+    horizons = np.arange(1, 251)
+    for cls in (GARCHModel, GJRModel):
+        m = cls()
+        m.fit(s)
+        path = m.forecast_path(horizons)
+        omega, beta = m.params[0], m.params[-1]
+        p = m.params[1] + beta if cls is GARCHModel else m.params[1] + 0.5 * m.params[2] + beta
+        expected = [m._next_sigma2(m.params, m._last_sigma2, m._last_return)]
+        for _ in horizons[1:]:
+            expected.append(omega + p * expected[-1])
+        np.testing.assert_allclose(path, expected, rtol=1e-10)
+        assert m.forecast(horizon=10) == path[9]
+
+
+def test_egarch_forecast_path_matches_simulation():
+    from src.vollab.egarch import EGARCHModel, E_ABS_Z
+    rng = np.random.default_rng(11)
+    params = np.array([-0.4, 0.12, -0.06, 0.96])
+    sigma2_next = 2e-4
+    horizons = np.array([1, 2, 5, 20])
+    m = EGARCHModel()
+    path = m._forecast_path(params, sigma2_next, horizons)
+
+    omega, alpha, gamma, beta = params
+    ls = np.full(400_000, np.log(sigma2_next))
+    sims = {1: np.exp(ls).mean()}
+    for h in range(2, horizons.max() + 1):
+        z = rng.standard_normal(ls.size)
+        ls = omega + alpha * (np.abs(z) - E_ABS_Z) + gamma * z + beta * ls
+        sims[h] = np.exp(ls).mean()
+    np.testing.assert_allclose(path, [sims[h] for h in horizons], rtol=1e-2)
+
+    idx = pd.date_range("2000-01-01", periods=500, freq="B")
+    m.fit(pd.Series(rng.normal(scale=0.01, size=500), index=idx))
+    assert (m.fitted_sigma2 > 0).all()
+    assert m.forecast() == m.forecast_path([1])[0]
@@ -0,0 +1,57 @@
+# --- tests/test_streaming.py ---
+
+import threading
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from src.vollab.garch import GARCHModel
+from src.vollab.gjr import GJRModel
+from src.vollab.streaming import StreamingFilter
+
+def _returns(n, seed=2):
+    rng = np.random.default_rng(seed)
+    r = rng.normal(scale=0.01, size=n) * (1 + 0.5 * np.sin(np.arange(n) / 40))
+    return pd.Series(r, index=pd.date_range("2000-01-01", periods=n, freq="B"))
+
+def test_update_matches_model_filter():
+    s = _returns(600)
+    for cls in (GARCHModel, GJRModel):
+        m = cls()
+        m.fit(s.iloc[:400])
+        f = StreamingFilter(m, history=s.iloc[:400].values)
+        ref = cls()
+        ref.fit(s.iloc[:400])
+        for r in s.iloc[400:]:
+            f.update(r)
+            ref.update(r)
+        assert abs(f.sigma2 - ref.forecast()) <= 1e-15
+        np.testing.assert_allclose(f.forecast_path([1, 10, 250]),
+                                   ref.forecast_path([1, 10, 250]), rtol=1e-12)
+
+def test_background_refit_swaps_in_with_catch_up():
+    s = _returns(700)
+    m = GARCHModel()
+    m.fit(s.iloc[:300])
+    executor = ThreadPoolExecutor(max_workers=1)
+    gate = threading.Event()
+    executor.submit(gate.wait)          # hold the worker so the refit stays in flight
+    f = StreamingFilter(m, window=300, refit_every=50, history=s.iloc[:300].values, executor=executor)
+
+    old_params = m.params.copy()
+    for r in s.iloc[300:380]:
+        f.update(r)
+    # refit queued at the 50th update, 30 more returns arrived meanwhile
+    assert f.n_refits == 0 and np.array_equal(f.params, old_params)
+    gate.set()
+    f.wait()
+    assert f.n_refits == 1 and f.last_refit_error is None
+
+    expected = GARCHModel()
+    expected.fit(pd.Series(s.iloc[50:350].values), x0=old_params)
+    np.testing.assert_allclose(f.params, expected.params)
+    sigma2 = expected.forecast()
+    for r in s.iloc[350:380]:
+        sigma2 = expected._next_sigma2(expected.params, sigma2, r)
+    assert abs(f.sigma2 - sigma2) <= 1e-12 * sigma2
+    f.close()
+    executor.shutdown()